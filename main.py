@@ -4,7 +4,9 @@ Main entry point for the refactored NCAA scraper.
 This is a simple wrapper that imports and runs the main function from the ncaa_scraper package.
 """
 
+import sys
+
 from ncaa_scraper.main import main
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -27,6 +27,7 @@ class Gender(Enum):
 
 # Google Drive API configuration
 GOOGLE_DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive.file']
+GDRIVE_PRECHECK_WORKERS = 8  # Parallel existence checks before a scraping session
 
 # NCAA URL patterns
 NCAA_BASE_URL = "https://stats.ncaa.org/contests/livestream_scoreboards"
@@ -38,5 +39,6 @@ DEFAULT_TOKEN_FILE = "token.pickle"
 DEFAULT_REDIRECT_URI = "urn:ietf:wg:oauth:2.0:oob"
 
 # Selenium configuration
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 DEFAULT_WAIT_TIMEOUT = 15
 DEFAULT_SLEEP_TIME = 2
@@ -13,6 +13,11 @@ from .scrapers.selenium_utils import SeleniumUtils
 from .utils import format_date_for_url, generate_ncaa_urls, parse_url_components
 from datetime import date, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -150,8 +155,12 @@ def discover_games(
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(result, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(result, f, indent=2)
     
     logger.info(f"Saved game links mapping to {output_path.absolute()}")
     
@@ -159,9 +168,12 @@ def discover_games(
 
 
 def load_game_links_mapping(mapping_file: str) -> Dict:
-    """Load game links mapping from JSON file."""
-    with open(mapping_file, 'r') as f:
-        return json.load(f)
+    """Load game links mapping from JSON file, using orjson when it is installed."""
+    with open(mapping_file, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def get_games_for_division_gender(
@@ -1,13 +1,728 @@
-"""Module for tracking and retrying failed games."""
+"""Module for tracking and retrying failed games.
 
+Failed games are kept in a JSON snapshot file. Updates made through
+FailedGamesWriter are appended to a newline-delimited journal next to it
+(``<file>.journal``) and folded into the snapshot when the writer is
+compacted, so recording a failure never rewrites the whole file.
+Journal appends and compaction hold an exclusive lock on ``<file>.lock``,
+so several scraper processes can share one failed games file.
+
+If the failed games path is an existing directory, the snapshot is
+sharded into one ``<YYYY-MM-DD>.json`` file per date inside it, and a
+write only touches the shards of the dates that changed.
+
+The snapshot is written without indentation; pretty-print it with
+``python -m json.tool failed_games.json`` when inspecting it by hand.
+"""
+
+import copy
 import json
 import logging
+import mmap
+import os
+import shutil
+import stat
+from contextlib import contextmanager
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import date
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl; lock with msvcrt instead
+    fcntl = None
+    import msvcrt
+
 logger = logging.getLogger(__name__)
 
+# Journal records written before the snapshot is rewritten mid-session
+JOURNAL_COMPACT_THRESHOLD = 500
+
+# Snapshots at least this large are parsed straight from a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+# Fields of a save record, in the order _SAVE_RECORD_TEMPLATE expects them
+_SAVE_RECORD_FIELDS = ('date', 'link', 'division', 'gender', 'error_type', 'error_message')
+
+# Journal line for a save record, the bulk of what gets written
+_SAVE_RECORD_TEMPLATE = (
+    b'{"op":"save","date":%b,"link":%b,"division":%b,"gender":%b,'
+    b'"error_type":%b,"error_message":%b}\n'
+)
+
+# Parsed failed games per file path, with the stat stamp they were read at
+_cache: Dict[str, Tuple[Tuple, Dict]] = {}
+
+# Parent directories already created by this process
+_dirs_created: Set[Path] = set()
+
+
+def _loads(raw: bytes) -> Dict:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_file(f) -> Dict:
+    """Parse an open JSON file, memory-mapping it when it is large."""
+    if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+    return _loads(f.read())
+
+
+def _dumps(failed_games: Dict) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(failed_games, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(failed_games, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def _dumps_record(record: Dict) -> bytes:
+    """Serialize a journal record as a single JSON line."""
+    # The template only handles strings; anything else (None, ints) goes through the encoder
+    if record['op'] == 'save' and all(isinstance(record[field], str) for field in _SAVE_RECORD_FIELDS):
+        return _SAVE_RECORD_TEMPLATE % tuple(
+            encode_basestring_ascii(record[field]).encode('ascii')
+            for field in _SAVE_RECORD_FIELDS
+        )
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _journal_path(output_path: Path) -> Path:
+    """Path of the journal that belongs to a failed games file."""
+    return output_path.with_name(output_path.name + '.journal')
+
+
+def _lock_path(output_path: Path) -> Path:
+    """Path of the lock file that guards a failed games file and its journal."""
+    return output_path.with_name(output_path.name + '.lock')
+
+
+@contextmanager
+def _locked(lock_path: Path):
+    """Hold an exclusive inter-process lock on lock_path for the duration of the block."""
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _append_journal(journal_path: Path, record: Dict):
+    """Append one record to a journal, starting a new line after a torn write."""
+    with open(journal_path, 'a+b') as f:
+        line = _dumps_record(record)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+
+def _ensure_parent(output_path: Path):
+    """Create the parent directory of a failed games file once per process."""
+    parent = output_path.parent
+    if parent not in _dirs_created:
+        parent.mkdir(parents=True, exist_ok=True)
+        _dirs_created.add(parent)
+
+
+def _shard_path(output_path: Path, date_key: str) -> Path:
+    """Path of one date's shard inside a sharded failed games directory."""
+    return output_path / f"{date_key}.json"
+
+
+def _read_shard(output_path: Path, date_key: str) -> Dict:
+    """Read one date's shard; a missing or empty shard has no failed games."""
+    try:
+        with open(_shard_path(output_path, date_key), 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            return _migrate_failed_games({date_key: _load_file(f)})[date_key]
+    except FileNotFoundError:
+        return {}
+
+
+def _read_failed_games(output_path: Path) -> Dict:
+    """Read the failed games file and replay any journal left next to it."""
+    failed_games = _read_snapshot(output_path)
+    
+    try:
+        _replay_journal(failed_games, _journal_path(output_path))
+    except FileNotFoundError:
+        pass
+    return failed_games
+
+
+def _set_aside_corrupt(path: Path, error: Exception):
+    """
+    Keep a copy of an unreadable failed games file before it is started over.
+    
+    The file is copied rather than renamed, because a bind-mounted file
+    cannot be renamed away.
+    """
+    backup = path.with_name(path.name + '.corrupt')
+    logger.warning(f"Failed games file {path} is unreadable ({error}), keeping a copy at {backup} and starting it over")
+    try:
+        shutil.copyfile(path, backup)
+    except OSError as e:
+        logger.warning(f"Could not copy unreadable failed games file {path}: {e}")
+
+
+def _read_snapshot(output_path: Path, dates: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Read the failed games file (or shard directory) without the journal.
+    
+    An unreadable (e.g. truncated) file is copied aside and read as empty,
+    so the journal can still be replayed and compacted over it.
+    
+    Args:
+        output_path: Failed games file, or directory of per-date shards
+        dates: Shards to read (sharded layout only, None for all)
+    """
+    failed_games = {}
+    try:
+        st = os.stat(output_path)
+    except FileNotFoundError:
+        return failed_games
+    
+    if stat.S_ISDIR(st.st_mode):
+        if dates is None:
+            dates = sorted(shard.stem for shard in output_path.glob('*.json'))
+        for date_key in dates:
+            date_failed = _read_shard(output_path, date_key)
+            if date_failed:
+                failed_games[date_key] = date_failed
+    # The workflow pre-creates an empty file; there is nothing to parse
+    elif st.st_size:
+        try:
+            with open(output_path, 'rb') as f:
+                failed_games = _migrate_failed_games(_load_file(f))
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            _set_aside_corrupt(output_path, e)
+            failed_games = {}
+    return failed_games
+
+
+def _stat_stamp(output_path: Path) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime, size) of the snapshot and its journal, None for missing files."""
+    # For a shard directory, os.replace of a shard bumps the directory mtime
+    stamp = []
+    for path in (output_path, _journal_path(output_path)):
+        try:
+            st = os.stat(path)
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _load_cached(output_path: Path) -> Dict:
+    """
+    Return the parsed failed games, reparsing only if the files changed.
+    
+    The returned dictionary is shared with other callers, so it must not be
+    modified; FailedGamesWriter works on its own deep copy.
+    """
+    key = str(output_path)
+    stamp = _stat_stamp(output_path)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    failed_games = _read_failed_games(output_path)
+    _cache[key] = (stamp, failed_games)
+    return failed_games
+
+
+def _read_failed_date(output_path: Path, date_key: str) -> Optional[Dict]:
+    """
+    Read only one date's failed games.
+    
+    A sharded directory reads just that date's shard; a single snapshot is
+    streamed with ijson and parsing stops at the requested date. Returns
+    None when neither applies: a journal has to be replayed on top of the
+    snapshot, ijson is not installed, or the cache already holds a current
+    copy.
+    """
+    if _journal_path(output_path).exists():
+        return None
+    
+    st = os.stat(output_path)
+    if stat.S_ISDIR(st.st_mode):
+        return _read_shard(output_path, date_key)
+    
+    if st.st_size == 0:
+        return {}
+    
+    if ijson is None:
+        return None
+    cached = _cache.get(str(output_path))
+    if cached is not None and cached[0] == _stat_stamp(output_path):
+        return None
+    
+    try:
+        with open(output_path, 'rb') as f:
+            for key, value in ijson.kvitems(f, '', use_float=True):
+                if key == date_key:
+                    return _migrate_failed_games({key: value})[key]
+    except ijson.JSONError:
+        # Unreadable file; the full read copies it aside and treats it as empty
+        return None
+    return {}
+
+
+def _write_failed_games(output_path: Path, failed_games: Dict, dates: Optional[Iterable[str]] = None):
+    """
+    Persist the failed games dictionary.
+    
+    Args:
+        output_path: Failed games file, or directory of per-date shards
+        failed_games: Failed games dictionary
+        dates: Dates whose shards changed (sharded layout only, None for all)
+    """
+    if not output_path.is_dir():
+        _atomic_write(output_path, _dumps(failed_games))
+        return
+    
+    if dates is None:
+        dates = set(failed_games) | {shard.stem for shard in output_path.glob('*.json')}
+    for date_key in dates:
+        shard = _shard_path(output_path, date_key)
+        if failed_games.get(date_key):
+            _atomic_write(shard, _dumps(failed_games[date_key]))
+            continue
+        try:
+            shard.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _atomic_write(output_path: Path, payload: bytes):
+    """Atomically replace a file with the given bytes."""
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    try:
+        os.replace(tmp_path, output_path)
+    except OSError as e:
+        # A file bind-mounted into a container (as the workflow does) cannot
+        # be renamed over, so fall back to rewriting it in place
+        logger.debug(f"Could not replace {output_path} atomically ({e}), rewriting in place")
+        os.unlink(tmp_path)
+        with open(output_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _read_journal(journal_path: Path) -> List[Dict]:
+    """Parse every readable record in a journal file."""
+    records = []
+    with open(journal_path, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(_loads(line))
+            except Exception as e:
+                # A crash mid-append can leave a truncated last line
+                logger.warning(f"Skipping unreadable journal line {line_number} in {journal_path}: {e}")
+    return records
+
+
+def _replay_journal(failed_games: Dict, journal_path: Path) -> Set[str]:
+    """
+    Apply every record in a journal file to the failed games dictionary.
+    
+    Returns:
+        Set of dates the journal touched
+    """
+    dates = set()
+    for record in _read_journal(journal_path):
+        _apply_record(failed_games, record)
+        dates.add(record['date'])
+    return dates
+
+
+@lru_cache(maxsize=1024)
+def _date_key(target_date: date) -> str:
+    """Key of a date in the failed games dictionary (ISO format, as in the file)."""
+    return target_date.isoformat()
+
+
+@lru_cache(maxsize=64)
+def _entry_key(division: str, gender: str) -> str:
+    """Key of a game link's entry for a division/gender combination."""
+    return f"{division}|{gender}"
+
+
+def _migrate_failed_games(failed_games: Dict) -> Dict:
+    """
+    Bring entries written by older versions up to the current format.
+    
+    Entries stored in the old list format are converted to the keyed format,
+    and entries missing a retry count get one of 0.
+    """
+    for date_failed in failed_games.values():
+        for game_link, entries in date_failed.items():
+            if isinstance(entries, list):
+                entries = date_failed[game_link] = {
+                    _entry_key(entry['division'], entry['gender']): entry
+                    for entry in entries
+                }
+            for entry in entries.values():
+                entry.setdefault('retry_count', 0)
+    return failed_games
+
+
+def _record_changes(failed_games: Dict, record: Dict) -> bool:
+    """
+    Check whether applying a journal record would change the failed games dictionary.
+    
+    Returns:
+        False if _apply_record() would treat the record as a no-op, True otherwise
+    """
+    entry = failed_games.get(record['date'], {}).get(record['link'], {}).get(
+        _entry_key(record['division'], record['gender'])
+    )
+    if record['op'] == 'save':
+        return not (
+            entry
+            and entry['error_type'] == record['error_type']
+            and entry['error_message'] == record['error_message']
+        )
+    return bool(entry)
+
+
+def _apply_record(failed_games: Dict, record: Dict) -> bool:
+    """
+    Apply a single save/retry journal record to the failed games dictionary.
+    
+    Returns:
+        True if the dictionary changed, False if the record was a no-op
+    """
+    date_key = record['date']
+    game_link = record['link']
+    division = record['division']
+    gender = record['gender']
+    key = _entry_key(division, gender)
+    
+    if record['op'] == 'save':
+        # Initialize structure if needed
+        if date_key not in failed_games:
+            failed_games[date_key] = {}
+        
+        # Add or update failed game entry
+        if game_link not in failed_games[date_key]:
+            failed_games[date_key][game_link] = {}
+        
+        # Check if this division/gender combination already exists
+        entries = failed_games[date_key][game_link]
+        existing_entry = entries.get(key)
+        
+        if existing_entry:
+            # Repeated identical failures (e.g. during an outage) change nothing
+            if (existing_entry['error_type'] == record['error_type']
+                    and existing_entry['error_message'] == record['error_message']):
+                return False
+            
+            # Update existing entry
+            existing_entry['error_type'] = record['error_type']
+            existing_entry['error_message'] = record['error_message']
+        else:
+            # Add new entry
+            entries[key] = {
+                'division': division,
+                'gender': gender,
+                'error_type': record['error_type'],
+                'error_message': record['error_message'],
+                'retry_count': 0
+            }
+        return True
+    
+    # op == 'retry'
+    if date_key not in failed_games:
+        return False
+    
+    if game_link not in failed_games[date_key]:
+        return False
+    
+    # Update retry count or remove if successful
+    entries = failed_games[date_key][game_link]
+    entry = entries.get(key)
+    if not entry:
+        return False
+    
+    if record['success']:
+        # Remove this entry
+        del entries[key]
+        # If no more entries for this game, remove the game entirely
+        if not entries:
+            del failed_games[date_key][game_link]
+    else:
+        # Increment retry count
+        entry['retry_count'] += 1
+    
+    # If date has no more failed games, remove it
+    if not failed_games[date_key]:
+        del failed_games[date_key]
+    return True
+
+
+class FailedGamesWriter:
+    """
+    Batch updates to the failed games file.
+    
+    The file (and any pending journal) is loaded once on enter; with a
+    sharded directory, each date's shard is loaded only when a record for
+    that date arrives, and compaction rewrites only the touched shards. Each
+    save/mark_retried call updates the in-memory dictionary and appends one
+    line to the shared journal; the snapshot is rewritten only when the
+    writer is compacted, which happens on exit and every
+    JOURNAL_COMPACT_THRESHOLD records. Compaction re-reads the snapshot and
+    replays the journal under the lock, so records appended by other
+    processes are applied exactly once instead of being overwritten.
+    
+    Usage:
+        with FailedGamesWriter(failed_games_file) as writer:
+            writer.save(game_link, target_date, division, gender)
+    """
+    
+    def __init__(self, failed_games_file: str):
+        self.output_path = Path(failed_games_file)
+        self.journal_path = _journal_path(self.output_path)
+        self.lock_path = _lock_path(self.output_path)
+        self.data: Dict = {}
+        self._journal_records = 0
+        self._dirty_dates = set()
+        self._rewrite_all = False
+        self._sharded = False
+        self._loaded_dates = set()
+    
+    def __enter__(self) -> 'FailedGamesWriter':
+        _ensure_parent(self.output_path)
+        self._sharded = self.output_path.is_dir()
+        self._loaded_dates = set()
+        with _locked(self.lock_path):
+            if self._sharded:
+                # Shards are read on demand, see _load_date
+                self.data = {}
+            else:
+                try:
+                    # Several writers can be open at once (retry partitions run in
+                    # threads), so each one mutates a private copy, never the cache
+                    self.data = copy.deepcopy(_load_cached(self.output_path))
+                except Exception as e:
+                    logger.warning(f"Error loading failed games file: {e}, creating new one")
+                    self.data = {}
+            pending_journal = self.journal_path.exists()
+        
+        # Fold in a journal left by an interrupted (or concurrent) run
+        if pending_journal:
+            logger.info(f"Folding pending failed games journal {self.journal_path}")
+            self._rewrite_all = True
+            self.compact()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Persist whatever was recorded, even if the caller raised
+        self.compact()
+        return False
+    
+    def compact(self):
+        """Fold the journal into the failed games file and remove it."""
+        # Nothing recorded since the last write, the snapshot is current
+        if not (self._dirty_dates or self._rewrite_all):
+            return
+        
+        try:
+            with _locked(self.lock_path):
+                if self._sharded:
+                    self._compact_shards()
+                else:
+                    self._compact_snapshot()
+                try:
+                    self.journal_path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._dirty_dates = set()
+            self._rewrite_all = False
+        except Exception as e:
+            logger.error(f"Error writing failed games file: {e}")
+            _cache.pop(str(self.output_path), None)
+        self._journal_records = 0
+    
+    def _compact_snapshot(self):
+        """Rewrite the single failed games file with the journal applied (lock held)."""
+        failed_games = _read_snapshot(self.output_path)
+        try:
+            journal_dates = _replay_journal(failed_games, self.journal_path)
+        except FileNotFoundError:
+            journal_dates = set()
+        
+        dates = None if self._rewrite_all else self._dirty_dates | journal_dates
+        _write_failed_games(self.output_path, failed_games, dates)
+        self.data = failed_games
+        _cache[str(self.output_path)] = (_stat_stamp(self.output_path), copy.deepcopy(failed_games))
+    
+    def _compact_shards(self):
+        """Rewrite only the shards the journal touched (lock held)."""
+        try:
+            records = _read_journal(self.journal_path)
+        except FileNotFoundError:
+            records = []
+        
+        dates = self._dirty_dates | {record['date'] for record in records}
+        failed_games = _read_snapshot(self.output_path, dates)
+        for record in records:
+            _apply_record(failed_games, record)
+        _write_failed_games(self.output_path, failed_games, dates)
+        
+        for date_key in dates:
+            self.data[date_key] = failed_games.get(date_key, {})
+        self._loaded_dates |= dates
+        # The cache holds whole directories, and these shards just changed
+        _cache.pop(str(self.output_path), None)
+    
+    def _load_date(self, date_key: str):
+        """Read one date's shard into memory the first time it is recorded to."""
+        if not self._sharded or date_key in self._loaded_dates:
+            return
+        with _locked(self.lock_path):
+            self.data[date_key] = _read_shard(self.output_path, date_key)
+            # Records other writers journaled since their last compaction
+            try:
+                for record in _read_journal(self.journal_path):
+                    if record['date'] == date_key:
+                        _apply_record(self.data, record)
+            except FileNotFoundError:
+                pass
+        self._loaded_dates.add(date_key)
+    
+    def _record(self, record: Dict):
+        """Append a record to the journal and apply it in memory if it changes anything."""
+        self._load_date(record['date'])
+        if not _record_changes(self.data, record):
+            return
+        
+        # Journal first, so memory never holds a change that would be lost on restart
+        try:
+            with _locked(self.lock_path):
+                _append_journal(self.journal_path, record)
+        except Exception as e:
+            logger.error(f"Error appending to failed games journal: {e}")
+            return
+        
+        _apply_record(self.data, record)
+        self._dirty_dates.add(record['date'])
+        self._journal_records += 1
+        
+        if self._journal_records >= JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+    
+    def save(
+        self,
+        game_link: str,
+        date: date,
+        division: str,
+        gender: str,
+        error_type: str = "timeout",
+        error_message: str = ""
+    ):
+        """
+        Record a failed game.
+        
+        Args:
+            game_link: URL of the failed game
+            date: Date of the game
+            division: Division (d1, d2, d3)
+            gender: Gender (men, women)
+            error_type: Type of error (timeout, driver_error, etc.)
+            error_message: Error message
+        """
+        self._record({
+            'op': 'save',
+            'date': _date_key(date),
+            'link': str(game_link),
+            'division': division,
+            'gender': gender,
+            'error_type': error_type,
+            'error_message': error_message
+        })
+        logger.debug(f"Saved failed game: {game_link} ({division} {gender})")
+    
+    def mark_retried(
+        self,
+        game_link: str,
+        target_date: date,
+        division: str,
+        gender: str,
+        success: bool
+    ):
+        """
+        Mark a failed game as retried and remove it if successful.
+        
+        Args:
+            game_link: URL of the game
+            target_date: Date of the game
+            division: Division (d1, d2, d3)
+            gender: Gender (men, women)
+            success: Whether the retry was successful
+        """
+        self._record({
+            'op': 'retry',
+            'date': _date_key(target_date),
+            'link': str(game_link),
+            'division': division,
+            'gender': gender,
+            'success': success
+        })
+
+
+def compact_failed_games(failed_games_file: str):
+    """
+    Fold a leftover journal into the failed games file.
+    
+    Args:
+        failed_games_file: Path to the failed games JSON file
+    """
+    with FailedGamesWriter(failed_games_file):
+        pass
+
 
 def save_failed_game(
     failed_games_file: str,
@@ -30,55 +745,8 @@ def save_failed_game(
         error_type: Type of error (timeout, driver_error, etc.)
         error_message: Error message
     """
-    output_path = Path(failed_games_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Load existing failed games
-    failed_games = {}
-    if output_path.exists():
-        try:
-            with open(output_path, 'r') as f:
-                failed_games = json.load(f)
-        except Exception as e:
-            logger.warning(f"Error loading failed games file: {e}, creating new one")
-            failed_games = {}
-    
-    # Initialize structure if needed
-    date_key = date.isoformat()
-    if date_key not in failed_games:
-        failed_games[date_key] = {}
-    
-    # Add or update failed game entry
-    if game_link not in failed_games[date_key]:
-        failed_games[date_key][game_link] = []
-    
-    # Check if this division/gender combination already exists
-    existing_entry = None
-    for entry in failed_games[date_key][game_link]:
-        if entry['division'] == division and entry['gender'] == gender:
-            existing_entry = entry
-            break
-    
-    if existing_entry:
-        # Update existing entry
-        existing_entry['error_type'] = error_type
-        existing_entry['error_message'] = error_message
-        existing_entry['retry_count'] = existing_entry.get('retry_count', 0)
-    else:
-        # Add new entry
-        failed_games[date_key][game_link].append({
-            'division': division,
-            'gender': gender,
-            'error_type': error_type,
-            'error_message': error_message,
-            'retry_count': 0
-        })
-    
-    # Save to file
-    with open(output_path, 'w') as f:
-        json.dump(failed_games, f, indent=2)
-    
-    logger.debug(f"Saved failed game: {game_link} ({division} {gender})")
+    with FailedGamesWriter(failed_games_file) as writer:
+        writer.save(game_link, date, division, gender, error_type, error_message)
 
 
 def load_failed_games(failed_games_file: str, target_date: date = None) -> Dict:
@@ -88,25 +756,25 @@ def load_failed_games(failed_games_file: str, target_date: date = None) -> Dict:
     Args:
         failed_games_file: Path to the failed games JSON file
         target_date: Optional date to filter by (if None, returns all)
-        
+    
     Returns:
         Dictionary of failed games, optionally filtered by date
     """
     output_path = Path(failed_games_file)
     
-    if not output_path.exists():
+    if not output_path.exists() and not _journal_path(output_path).exists():
         logger.info(f"No failed games file found at {output_path}")
         return {}
     
     try:
-        with open(output_path, 'r') as f:
-            failed_games = json.load(f)
-        
         if target_date:
-            date_key = target_date.isoformat()
-            return {date_key: failed_games.get(date_key, {})}
+            date_key = _date_key(target_date)
+            date_failed = _read_failed_date(output_path, date_key)
+            if date_failed is not None:
+                return {date_key: date_failed}
+            return {date_key: _load_cached(output_path).get(date_key, {})}
         
-        return failed_games
+        return _load_cached(output_path)
     except Exception as e:
         logger.error(f"Error loading failed games file: {e}")
         return {}
@@ -126,21 +794,13 @@ def get_failed_games_for_division_gender(
         target_date: Date to filter by
         division: Division (d1, d2, d3)
         gender: Gender (men, women)
-        
+    
     Returns:
         List of failed game links
     """
-    date_key = target_date.isoformat()
-    game_links = []
-    
-    date_failed = failed_games.get(date_key, {})
-    for game_link, entries in date_failed.items():
-        for entry in entries:
-            if entry['division'] == division and entry['gender'] == gender:
-                game_links.append(game_link)
-                break
-    
-    return game_links
+    key = _entry_key(division, gender)
+    date_failed = failed_games.get(_date_key(target_date), {})
+    return [game_link for game_link, entries in date_failed.items() if key in entries]
 
 
 def mark_game_as_retried(
@@ -162,50 +822,9 @@ def mark_game_as_retried(
         gender: Gender (men, women)
         success: Whether the retry was successful
     """
-    output_path = Path(failed_games_file)
-    
-    if not output_path.exists():
+    if not Path(failed_games_file).exists():
         return
     
-    try:
-        with open(output_path, 'r') as f:
-            failed_games = json.load(f)
-        
-        date_key = target_date.isoformat()
-        if date_key not in failed_games:
-            return
-        
-        if game_link not in failed_games[date_key]:
-            return
-        
-        # Update retry count or remove if successful
-        entries = failed_games[date_key][game_link]
-        for i, entry in enumerate(entries):
-            if entry['division'] == division and entry['gender'] == gender:
-                if success:
-                    # Remove this entry
-                    entries.pop(i)
-                    # If no more entries for this game, remove the game entirely
-                    if not entries:
-                        del failed_games[date_key][game_link]
-                else:
-                    # Increment retry count
-                    entry['retry_count'] = entry.get('retry_count', 0) + 1
-                break
-        
-        # If date has no more failed games, remove it
-        if date_key in failed_games and not failed_games[date_key]:
-            del failed_games[date_key]
-        
-        # Save updated file
-        with open(output_path, 'w') as f:
-            json.dump(failed_games, f, indent=2)
-            
-    except Exception as e:
-        logger.error(f"Error updating failed games file: {e}")
-
-
-
-
-
+    with FailedGamesWriter(failed_games_file) as writer:
+        writer.mark_retried(game_link, target_date, division, gender, success)
 
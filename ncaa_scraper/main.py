@@ -3,19 +3,25 @@
 import argparse
 import logging
 import os
-import shutil
-from datetime import date
-from typing import List
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+import pandas as pd
 
 from .config import get_config, Division, Gender
-from .scrapers import NCAAScraper
+from .scrapers import NCAAScraper, DriverPool
 from .scrapers.selenium_utils import SeleniumUtils
-from .utils import get_yesterday, format_date_for_url, generate_ncaa_urls
+from .scrapers.driver_pool import DRIVER_RECYCLE_INTERVAL
+from .storage import GoogleDriveManager
+from .utils import get_yesterday, format_date_for_url, generate_ncaa_urls, parse_url_components
 from .models import ScrapingConfig, DateRange
-from .config.constants import ErrorType
+from .config.constants import ErrorType, GDRIVE_PRECHECK_WORKERS
 from .discovery import discover_games, load_game_links_mapping, get_games_for_division_gender
-from .failed_games import save_failed_game, load_failed_games, get_failed_games_for_division_gender, mark_game_as_retried
-import time
+from .failed_games import FailedGamesWriter, load_failed_games, get_failed_games_for_division_gender
 import json
 
 logger = logging.getLogger(__name__)
@@ -44,7 +50,8 @@ def main():
     parser.add_argument('--test-game-division', type=str, choices=['d1', 'd2', 'd3'], default='d1', help='Division for test game (default: d1)')
     parser.add_argument('--test-game-gender', type=str, choices=['men', 'women'], default='men', help='Gender for test game (default: men)')
     parser.add_argument('--retry-failed', action='store_true', help='Retry scraping failed games from previous runs')
-    parser.add_argument('--failed-games-file', type=str, default='failed_games.json', help='Path to failed games JSON file')
+    parser.add_argument('--concurrency', type=int, default=1, help='Number of date/gender scoreboard groups (or retry genders) to scrape in parallel, each with its own browser (default: 1)')
+    parser.add_argument('--failed-games-file', type=str, default='failed_games.json', help='Path to failed games JSON file (or an existing directory to keep one file per date)')
     
     args = parser.parse_args()
     
@@ -53,6 +60,19 @@ def main():
     if not config.validate():
         return 1
     
+    # Handle discovery mode (needs no output directory or Drive settings;
+    # --test-game still takes precedence)
+    if args.discover and not args.test_game:
+        target_date = _parse_date(args.date) if args.date else get_yesterday()
+        logger.info(f"Discovery mode: extracting game links for {target_date}")
+        try:
+            mapping = discover_games(target_date, "discovery/game_links_mapping.json")
+            logger.info(f"Discovery completed successfully. Found {mapping['total_games']} games.")
+            return 0
+        except Exception as e:
+            logger.error(f"Discovery failed: {e}")
+            return 1
+    
     # Override config with command line arguments
     if args.output_dir:
         config.output_dir = args.output_dir
@@ -63,15 +83,6 @@ def main():
     if args.no_upload_gdrive:
         config.upload_to_gdrive = False
     
-    # Convert division and gender strings to enums
-    divisions = [Division(d) for d in args.divisions]
-    genders = [Gender(g) for g in args.genders]
-    
-    # Create output directory
-    import os
-    os.makedirs(config.output_dir, exist_ok=True)
-    logger.info(f"Output directory: {os.path.abspath(config.output_dir)}")
-    
     # Handle test game mode
     if args.test_game:
         logger.info(f"Test game mode: testing {args.test_game}")
@@ -90,7 +101,6 @@ def main():
             else:
                 # If no date provided, use today as fallback (for testing purposes)
                 logger.warning("Date not provided for test game, using today's date")
-                from datetime import date
                 target_date = date.today()
             
             year = str(target_date.year)
@@ -142,18 +152,6 @@ def main():
             logger.error(f"Error testing game: {e}", exc_info=True)
             return 1
     
-    # Handle discovery mode
-    if args.discover:
-        target_date = _parse_date(args.date) if args.date else get_yesterday()
-        logger.info(f"Discovery mode: extracting game links for {target_date}")
-        try:
-            mapping = discover_games(target_date, "discovery/game_links_mapping.json")
-            logger.info(f"Discovery completed successfully. Found {mapping['total_games']} games.")
-            return 0
-        except Exception as e:
-            logger.error(f"Discovery failed: {e}")
-            return 1
-    
     # Handle retry failed games mode
     if args.retry_failed:
         target_date = _parse_date(args.date) if args.date else get_yesterday()
@@ -167,7 +165,8 @@ def main():
                 logger.info(f"No failed games found for {target_date}")
                 return 0
             
-            logger.info(f"Found {sum(len(entries) for entries in failed_games[date_key].values())} failed game entries to retry")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found %d failed game entries to retry", sum(len(entries) for entries in failed_games[date_key].values()))
             
             # Initialize scraper
             scraper = NCAAScraper(config)
@@ -177,20 +176,35 @@ def main():
             all_divisions = ['d1', 'd2', 'd3']
             all_genders = ['men', 'women']
             
-            total_retried = 0
-            total_successful = 0
-            
-            for division in all_divisions:
-                for gender in all_genders:
+            # One partition per gender: the same game can fail under several
+            # divisions, and running them in order on one worker lets its
+            # visited_links skip the repeats
+            partitions = []
+            for gender in all_genders:
+                division_links = []
+                for division in all_divisions:
                     game_links = get_failed_games_for_division_gender(failed_games, target_date, division, gender)
-                    
-                    if not game_links:
-                        continue
-                    
+                    if game_links:
+                        division_links.append((division, game_links))
+                if division_links:
+                    partitions.append((gender, division_links))
+            
+            def retry_partition(partition) -> int:
+                gender, division_links = partition
+                
+                # Drive clients are not thread-safe, so parallel partitions each get their own scraper
+                worker = scraper
+                if args.concurrency > 1:
+                    worker = NCAAScraper(config)
+                    worker.force_rescrape = scraper.force_rescrape
+                    worker.driver_pool = scraper.driver_pool
+                
+                retried = 0
+                for division, game_links in division_links:
                     logger.info(f"Retrying {len(game_links)} failed games for {division} {gender}")
                     
                     _scrape_games_from_mapping(
-                        scraper,
+                        worker,
                         game_links,
                         target_date,
                         division,
@@ -199,8 +213,25 @@ def main():
                         failed_games_file=args.failed_games_file,
                         is_retry=True
                     )
-                    
-                    total_retried += len(game_links)
+                    retried += len(game_links)
+                return retried
+            
+            # Genders write separate CSVs and lock the failed games file per
+            # update, so they can run side by side; with --concurrency 1 one
+            # driver serves every division/gender combination
+            scraper.driver_pool = DriverPool(size=args.concurrency)
+            try:
+                if args.concurrency > 1:
+                    SeleniumUtils.parallel_drivers = True
+                    try:
+                        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                            total_retried = sum(executor.map(retry_partition, partitions))
+                    finally:
+                        SeleniumUtils.parallel_drivers = False
+                else:
+                    total_retried = sum(map(retry_partition, partitions))
+            finally:
+                scraper.driver_pool.close()
             
             logger.info(f"Retry completed: {total_retried} games retried")
             return 0
@@ -231,7 +262,6 @@ def main():
             scraper.duplicate_mapping = mapping
             
             # Scrape games
-            from .utils import parse_url_components
             components = parse_url_components(generate_ncaa_urls(format_date_for_url(target_date), [Division(args.single_division)], [Gender(args.single_gender)])[0])
             
             _scrape_games_from_mapping(
@@ -251,6 +281,14 @@ def main():
             logger.error(f"Error in single division/gender scraping: {e}")
             return 1
     
+    # Convert division and gender strings to enums
+    divisions = [Division(d) for d in args.divisions]
+    genders = [Gender(g) for g in args.genders]
+    
+    # Create output directory (the modes above create the directories they write to)
+    os.makedirs(config.output_dir, exist_ok=True)
+    logger.info(f"Output directory: {os.path.abspath(config.output_dir)}")
+    
     # Initialize scraper
     scraper = NCAAScraper(config)
     
@@ -267,7 +305,8 @@ def main():
                 scraping_config = ScrapingConfig.for_backfill(
                     [target_date], divisions, genders, config.output_dir, 
                     config.upload_to_gdrive, config.google_drive_folder_id,
-                    force_rescrape=args.force_rescrape
+                    force_rescrape=args.force_rescrape,
+                    concurrency=args.concurrency
                 )
                 _run_scraping_session(scraper, scraping_config)
         else:
@@ -278,7 +317,8 @@ def main():
             scraping_config = ScrapingConfig.for_single_date(
                 target_date, divisions, genders, config.output_dir,
                 config.upload_to_gdrive, config.google_drive_folder_id,
-                force_rescrape=args.force_rescrape
+                force_rescrape=args.force_rescrape,
+                concurrency=args.concurrency
             )
             _run_scraping_session(scraper, scraping_config)
         
@@ -294,7 +334,6 @@ def main():
 
 def _parse_date(date_str: str) -> date:
     """Parse date string to date object."""
-    from datetime import datetime
     try:
         return datetime.strptime(date_str, '%Y/%m/%d').date()
     except ValueError:
@@ -312,8 +351,6 @@ def _run_scraping_session(scraper: NCAAScraper, scraping_config: ScrapingConfig)
     current_date = scraping_config.date_range.start_date
     end_date = scraping_config.date_range.end_date or scraping_config.date_range.start_date
     
-    from datetime import timedelta
-    
     while current_date <= end_date:
         date_str = format_date_for_url(current_date)
         urls = generate_ncaa_urls(date_str, scraping_config.divisions, scraping_config.genders)
@@ -327,40 +364,85 @@ def _run_scraping_session(scraper: NCAAScraper, scraping_config: ScrapingConfig)
     elif scraping_config.force_rescrape:
         logger.info("Force rescrape enabled - will override existing Google Drive files")
     
-    # Scrape each URL with progress logging and cleanup between URLs
+    # Scrape each URL with progress logging
     total_urls = len(all_urls)
     logger.info(f"Starting scraping session: {total_urls} URLs to process")
     
-    for idx, url in enumerate(all_urls, 1):
-        try:
-            logger.info(f"Processing URL {idx}/{total_urls}: {url}")
-            scraper.scrape(url)
-            
-            # Cleanup driver between URLs to prevent resource buildup
-            if scraper.driver:
-                try:
-                    SeleniumUtils.safe_quit_driver(scraper.driver)
-                    scraper.driver = None
-                    SeleniumUtils._cleanup_driver_resources()
-                    time.sleep(2)  # Brief pause between URLs for resource cleanup
-                except Exception as cleanup_error:
-                    logger.warning(f"Error during driver cleanup between URLs: {cleanup_error}")
-                    
-        except Exception as e:
-            logger.error(f"Error processing URL {url}: {e}")
-            # Ensure driver is cleaned up even on error
-            if scraper.driver:
+    # Reuse drivers across URLs instead of restarting Chrome for each one
+    scraper.driver_pool = DriverPool(size=scraping_config.concurrency)
+    try:
+        if scraping_config.concurrency > 1:
+            _scrape_urls_concurrently(scraper, all_urls, scraping_config.concurrency)
+        else:
+            for idx, url in enumerate(all_urls, 1):
                 try:
-                    SeleniumUtils.safe_quit_driver(scraper.driver)
-                    scraper.driver = None
-                    SeleniumUtils._cleanup_driver_resources()
-                except Exception:
-                    pass
-            continue
+                    logger.info(f"Processing URL {idx}/{total_urls}: {url}")
+                    scraper.scrape(url)
+                except Exception as e:
+                    logger.error(f"Error processing URL {url}: {e}")
+                    # Hand the driver back even on error (the pool drops it if it is broken)
+                    scraper._release_driver()
+                    continue
+    finally:
+        scraper.driver_pool.close()
+        scraper.driver_pool = None
     
     logger.info(f"Completed scraping session: {total_urls} URLs processed")
 
 
+def _scrape_urls_concurrently(scraper: NCAAScraper, urls: List[str], concurrency: int):
+    """
+    Scrape URLs on a pool of worker threads.
+    
+    Each worker thread gets its own scraper (and so its own Google Drive
+    client, which is not thread-safe) and takes drivers from the session's
+    driver pool. URLs for the same date and gender are scraped by one
+    worker in their original order, because cross-division duplicates are
+    only found between them: that worker's visited links see every
+    division, and the earlier division's CSV it flags as duplicate is one
+    it has already finished writing, so no CSV is ever written by two
+    workers.
+    
+    Args:
+        scraper: Scraper whose configuration and state the workers share
+        urls: Scoreboard URLs to scrape
+        concurrency: Number of worker threads
+    """
+    local = threading.local()
+    total_urls = len(urls)
+    
+    groups: Dict[tuple, List[tuple]] = {}
+    for idx, url in enumerate(urls, 1):
+        components = parse_url_components(url)
+        key = (components['year'], components['month'], components['day'], components['gender'])
+        groups.setdefault(key, []).append((idx, url))
+    
+    def scrape_group(group: List[tuple]):
+        worker = getattr(local, 'scraper', None)
+        if worker is None:
+            worker = local.scraper = NCAAScraper(scraper.config)
+            worker.force_rescrape = scraper.force_rescrape
+            worker.gdrive_existing = scraper.gdrive_existing
+            worker.driver_pool = scraper.driver_pool
+        
+        for idx, url in group:
+            try:
+                logger.info(f"Processing URL {idx}/{total_urls}: {url}")
+                worker.scrape(url)
+            except Exception as e:
+                logger.error(f"Error processing URL {url}: {e}")
+            finally:
+                worker._release_driver()
+    
+    SeleniumUtils.parallel_drivers = True
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(scrape_group, group) for group in groups.values()]:
+                future.result()
+    finally:
+        SeleniumUtils.parallel_drivers = False
+
+
 def _scrape_games_from_mapping(
     scraper: NCAAScraper,
     game_links: List[str],
@@ -372,9 +454,6 @@ def _scrape_games_from_mapping(
     is_retry: bool = False
 ):
     """Scrape games from a list of game links (used in single division/gender mode)."""
-    from .utils import format_date_for_url
-    from .storage import FileManager
-    
     date_str = format_date_for_url(target_date)
     year = str(target_date.year)
     month = f"{target_date.month:02d}"
@@ -399,7 +478,7 @@ def _scrape_games_from_mapping(
     
     # Initialize driver
     try:
-        scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+        scraper._acquire_driver()
     except Exception as e:
         logger.error(f"Failed to initialize WebDriver: {e}")
         return
@@ -408,130 +487,120 @@ def _scrape_games_from_mapping(
         scraped_count = 0
         failed_count = 0
         
-        for idx, game_link in enumerate(game_links, 1):
-            try:
-                logger.info(f"Scraping game {idx}/{len(game_links)}: {game_link}")
-                
-                # Check if duplicate from discovery mapping
-                mapping = getattr(scraper, 'duplicate_mapping', {})
-                game_info = mapping.get('game_links', {}).get(game_link, {})
-                is_duplicate = game_info.get('is_duplicate', False)
-                primary_division = game_info.get('primary_division', division)
-                
-                # If it's a duplicate and we're not the primary division, try to copy first
-                if is_duplicate and primary_division != division:
-                    logger.info(f"Game is duplicate (primary: {primary_division}), attempting to copy from {primary_division} division")
-                    primary_csv_path = scraper.file_manager.get_csv_path(year, month, day, gender, primary_division)
+        # Discovery info per game link (duplicate status and primary division)
+        game_info_by_link = getattr(scraper, 'duplicate_mapping', {}).get('game_links', {})
+        
+        failed_games_writer = FailedGamesWriter(failed_games_file) if failed_games_file else nullcontext()
+        with failed_games_writer as failed_games, scraper.csv_handler.appending(csv_path):
+            # Copy duplicates the primary division already scraped before scraping anything
+            # (retry mode has no discovery mapping, so there is nothing to copy from)
+            copied = []
+            if not is_retry:
+                copied = _copy_duplicates_from_primary(
+                    scraper, game_links, game_info_by_link, year, month, day, gender, division, csv_path
+                )
+            scraped_count += len(copied)
+            
+            copied_links = set(copied)
+            remaining_links = [game_link for game_link in game_links if game_link not in copied_links]
+            
+            driver_suspect = False
+            for idx, game_link in enumerate(remaining_links, 1):
+                try:
+                    # Recreate the driver periodically, or after a failure if it stopped responding
+                    recycle = idx > 1 and (idx - 1) % DRIVER_RECYCLE_INTERVAL == 0
+                    if recycle or (driver_suspect and not DriverPool.is_alive(scraper.driver)):
+                        logger.info("Recreating driver after %d games...", idx - 1)
+                        try:
+                            SeleniumUtils._cleanup_driver_resources()
+                            SeleniumUtils.safe_quit_driver(scraper.driver)
+                            scraper.driver = None
+                            scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+                        except Exception as e:
+                            logger.warning(f"Error recreating driver: {e}")
+                    driver_suspect = False
+                    
+                    logger.info("Scraping game %d/%d: %s", idx, len(remaining_links), game_link)
                     
-                    # Try to read from primary CSV
-                    existing_data = scraper.csv_handler.get_game_data_by_link(primary_csv_path, game_link)
-                    if existing_data is not None and not existing_data.empty:
-                        # Mark as duplicate and copy
-                        existing_data = existing_data.copy()
-                        if 'DUPLICATE_ACROSS_DIVISIONS' not in existing_data.columns:
-                            existing_data['DUPLICATE_ACROSS_DIVISIONS'] = True
-                        else:
-                            existing_data['DUPLICATE_ACROSS_DIVISIONS'] = True
+                    # Check if duplicate from discovery mapping
+                    game_info = game_info_by_link.get(game_link, {})
+                    is_duplicate = game_info.get('is_duplicate', False)
+                    primary_division = game_info.get('primary_division', division)
+                    
+                    # Scrape the game (will be marked as duplicate if is_duplicate and not primary division)
+                    # Pass the duplicate status to the scraper
+                    game_data = scraper._scrape_single_game(
+                        game_link, year, month, day, gender, division, csv_path,
+                        is_duplicate_from_mapping=is_duplicate and primary_division != division
+                    )
+                    
+                    if game_data:
+                        scraped_count += 1
                         
-                        # Append to current division's CSV
-                        if scraper.csv_handler.append_game_data(csv_path, existing_data):
-                            logger.info(f"Copied duplicate game data from {primary_division}")
-                            scraped_count += 1
-                            
-                            # Mark as successful if retrying
-                            if is_retry and failed_games_file:
-                                mark_game_as_retried(failed_games_file, game_link, target_date, division, gender, success=True)
-                            
-                            continue
-                        else:
-                            logger.warning(f"Failed to copy, will scrape instead")
+                        # Mark as successful if retrying
+                        if is_retry and failed_games:
+                            failed_games.mark_retried(game_link, target_date, division, gender, success=True)
                     else:
-                        logger.info(f"Primary CSV doesn't exist yet, will scrape and mark as duplicate")
-                
-                # Scrape the game (will be marked as duplicate if is_duplicate and not primary division)
-                # Pass the duplicate status to the scraper
-                game_data = scraper._scrape_single_game(
-                    game_link, year, month, day, gender, division, csv_path,
-                    is_duplicate_from_mapping=is_duplicate and primary_division != division
-                )
-                
-                if game_data:
-                    scraped_count += 1
+                        failed_count += 1
+                        driver_suspect = True
+                        
+                        # Track failed game
+                        if failed_games:
+                            error_type = "timeout"  # Could be more specific based on error
+                            failed_games.save(
+                                game_link,
+                                target_date,
+                                division,
+                                gender,
+                                error_type=error_type,
+                                error_message="Game failed to scrape"
+                            )
+                        
+                        # Mark as failed if retrying
+                        if is_retry and failed_games:
+                            failed_games.mark_retried(game_link, target_date, division, gender, success=False)
                     
-                    # Mark as successful if retrying
-                    if is_retry and failed_games_file:
-                        mark_game_as_retried(failed_games_file, game_link, target_date, division, gender, success=True)
-                else:
+                except Exception as e:
+                    logger.error("Error scraping game %s: %s", game_link, e)
                     failed_count += 1
+                    driver_suspect = True
                     
                     # Track failed game
-                    if failed_games_file:
-                        error_type = "timeout"  # Could be more specific based on error
-                        save_failed_game(
-                            failed_games_file,
+                    if failed_games:
+                        error_type = "exception"
+                        failed_games.save(
                             game_link,
                             target_date,
                             division,
                             gender,
                             error_type=error_type,
-                            error_message="Game failed to scrape"
+                            error_message=str(e)
                         )
                     
                     # Mark as failed if retrying
-                    if is_retry and failed_games_file:
-                        mark_game_as_retried(failed_games_file, game_link, target_date, division, gender, success=False)
-                
-                # Recreate driver every 20 games
-                if idx > 0 and idx % 20 == 0:
-                    logger.info(f"Recreating driver after {idx} games...")
-                    try:
-                        SeleniumUtils._cleanup_driver_resources()
-                        SeleniumUtils.safe_quit_driver(scraper.driver)
-                        scraper.driver = None
-                        time.sleep(3)
-                        scraper.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                    except Exception as e:
-                        logger.warning(f"Error recreating driver: {e}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping game {game_link}: {e}")
-                failed_count += 1
-                
-                # Track failed game
-                if failed_games_file:
-                    error_type = "exception"
-                    save_failed_game(
-                        failed_games_file,
-                        game_link,
-                        target_date,
-                        division,
-                        gender,
-                        error_type=error_type,
-                        error_message=str(e)
-                    )
-                
-                # Mark as failed if retrying
-                if is_retry and failed_games_file:
-                    mark_game_as_retried(failed_games_file, game_link, target_date, division, gender, success=False)
-                
-                continue
+                    if is_retry and failed_games:
+                        failed_games.mark_retried(game_link, target_date, division, gender, success=False)
+                    
+                    continue
         
         logger.info(f"Scraped {scraped_count}/{len(game_links)} games successfully ({failed_count} failed)")
         
+        scraper.flush_duplicate_flags()
+        
         # If retrying and we downloaded an existing CSV, merge them
         if is_retry and existing_csv_path and os.path.exists(existing_csv_path):
             logger.info(f"Merging existing CSV with new data for {division} {gender}")
             merged_csv_path = csv_path + ".merged"
             
             if scraper.csv_handler.merge_csv_files(existing_csv_path, csv_path, merged_csv_path):
-                # Replace the new CSV with the merged one
-                shutil.move(merged_csv_path, csv_path)
+                # Replace the new CSV with the merged one (same directory, so a plain atomic rename)
+                os.replace(merged_csv_path, csv_path)
                 logger.info(f"Successfully merged CSV files for {division} {gender}")
                 
                 # Clean up the downloaded existing CSV
                 try:
-                    os.remove(existing_csv_path)
-                except Exception as e:
+                    os.unlink(existing_csv_path)
+                except OSError as e:
                     logger.warning(f"Failed to remove temporary existing CSV: {e}")
             else:
                 logger.warning(f"Failed to merge CSV files, uploading new CSV only")
@@ -542,42 +611,142 @@ def _scrape_games_from_mapping(
             scraper.upload_to_gdrive(csv_path, year, month, gender, division)
             
     finally:
-        if scraper.driver:
-            SeleniumUtils.safe_quit_driver(scraper.driver)
-            scraper.driver = None
+        scraper._release_driver()
+        if not scraper.driver_pool:
             SeleniumUtils._cleanup_driver_resources()
 
 
+def _copy_duplicates_from_primary(
+    scraper: NCAAScraper,
+    game_links: List[str],
+    game_info_by_link: Dict[str, Dict],
+    year: str,
+    month: str,
+    day: str,
+    gender: str,
+    division: str,
+    csv_path: str
+) -> List[str]:
+    """
+    Copy cross-division duplicates from their primary division's CSV.
+    
+    Rows for every duplicate the primary division has already scraped are
+    gathered first and appended in one write, so those games never reach
+    the browser.
+    
+    Args:
+        scraper: Scraper whose CSV handler reads and writes the files
+        game_links: Game links to scrape for this division
+        game_info_by_link: Discovery mapping entries keyed by game link
+        year: Year of the games
+        month: Month of the games
+        day: Day of the games
+        gender: Gender being scraped
+        division: Division being scraped
+        csv_path: CSV file for this division
+    
+    Returns:
+        Game links whose rows were copied
+    """
+    copied = []
+    frames = []
+    for game_link in game_links:
+        game_info = game_info_by_link.get(game_link, {})
+        primary_division = game_info.get('primary_division', division)
+        if not game_info.get('is_duplicate', False) or primary_division == division:
+            continue
+        
+        primary_csv_path = scraper.file_manager.get_csv_path(year, month, day, gender, primary_division, create_dirs=False)
+        existing_data = scraper.csv_handler.get_game_data_by_link(primary_csv_path, game_link)
+        if existing_data is None or existing_data.empty:
+            logger.info("Duplicate game %s not in %s CSV yet, will scrape and mark as duplicate", game_link, primary_division)
+            continue
+        
+        existing_data['DUPLICATE_ACROSS_DIVISIONS'] = True
+        frames.append(existing_data)
+        copied.append(game_link)
+    
+    if not frames:
+        return []
+    
+    if not scraper.csv_handler.append_game_data(csv_path, pd.concat(frames, ignore_index=True)):
+        logger.warning("Failed to copy duplicate games, will scrape them instead")
+        return []
+    
+    logger.info(f"Copied {len(copied)} duplicate games from their primary divisions")
+    return copied
+
+
 def _precheck_google_drive(scraper: NCAAScraper, urls: List[str]):
-    """Pre-check Google Drive for existing files to provide summary."""
+    """
+    Pre-check Google Drive for existing files to provide summary.
+    
+    The checks run in parallel and their results are stored in
+    scraper.gdrive_existing, so scraping does not query Drive again.
+    Dates whose CSV is already on local disk are skipped by the scraper
+    anyway, so they are not looked up in Drive.
+    """
     try:
-        from .utils import parse_url_components
-        
         existing_count = 0
         total_count = len(urls)
         
+        drive_urls = []
         for url in urls:
-            try:
-                components = parse_url_components(url)
-                year = components['year']
-                month = components['month']
-                day = components['day']
-                gender = components['gender']
-                division = components['division']
-                
-                gdrive_exists, _ = scraper.google_drive.check_file_exists_in_gdrive(
-                    year, month, gender, division, day
+            components = parse_url_components(url)
+            csv_path = scraper.file_manager.get_csv_path(
+                components['year'], components['month'], components['day'],
+                components['gender'], components['division'], create_dirs=False
+            )
+            if scraper.file_manager.file_exists_and_has_content(csv_path):
+                existing_count += 1
+                logger.info(
+                    "✓ %s %s %s-%s-%s already exists locally",
+                    components['gender'], components['division'], components['year'], components['month'], components['day']
                 )
+            else:
+                drive_urls.append(url)
+        
+        if not drive_urls:
+            logger.info(f"Google Drive pre-check complete: {existing_count}/{total_count} files already exist")
+            return
+        
+        # Authenticate (and refresh the token file) once before the workers read it
+        if not scraper.google_drive.service and not scraper.google_drive.authenticate():
+            logger.warning("Could not authenticate with Google Drive, skipping pre-check")
+            return
+        
+        local = threading.local()
+        
+        def check_url(url: str):
+            components = parse_url_components(url)
+            key = (components['year'], components['month'], components['day'], components['gender'], components['division'])
+            
+            # Drive clients are not thread-safe, so each thread uses its own
+            google_drive = getattr(local, 'google_drive', None)
+            if google_drive is None:
+                google_drive = local.google_drive = GoogleDriveManager(scraper.config)
+            
+            gdrive_exists, _ = google_drive.check_file_exists_in_gdrive(
+                components['year'], components['month'], components['gender'], components['division'], components['day']
+            )
+            return key, gdrive_exists
+        
+        with ThreadPoolExecutor(max_workers=GDRIVE_PRECHECK_WORKERS) as executor:
+            futures = [executor.submit(check_url, url) for url in drive_urls]
+            for url, future in zip(drive_urls, futures):
+                try:
+                    key, gdrive_exists = future.result()
+                except Exception as e:
+                    logger.warning("Error checking Google Drive for %s: %s", url, e)
+                    continue
                 
+                scraper.gdrive_existing[key] = gdrive_exists
+                year, month, day, gender, division = key
                 if gdrive_exists:
                     existing_count += 1
-                    logger.info(f"✓ {gender} {division} {year}-{month}-{day} already exists in Google Drive")
+                    logger.info("✓ %s %s %s-%s-%s already exists in Google Drive", gender, division, year, month, day)
                 else:
-                    logger.info(f"✗ {gender} {division} {year}-{month}-{day} needs scraping")
-                    
-            except Exception as e:
-                logger.warning(f"Error checking Google Drive for {url}: {e}")
-                continue
+                    logger.info("✗ %s %s %s-%s-%s needs scraping", gender, division, year, month, day)
         
         logger.info(f"Google Drive pre-check complete: {existing_count}/{total_count} files already exist")
         
@@ -586,4 +755,4 @@ def _precheck_google_drive(scraper: NCAAScraper, urls: List[str]):
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -27,6 +27,7 @@ class ScrapingConfig:
     upload_to_gdrive: bool = False
     gdrive_folder_id: Optional[str] = None
     force_rescrape: bool = False
+    concurrency: int = 1
     
     @classmethod
     def for_single_date(
@@ -37,7 +38,8 @@ class ScrapingConfig:
         output_dir: str = "scraped_data",
         upload_to_gdrive: bool = False,
         gdrive_folder_id: Optional[str] = None,
-        force_rescrape: bool = False
+        force_rescrape: bool = False,
+        concurrency: int = 1
     ) -> 'ScrapingConfig':
         """Create configuration for a single date."""
         if divisions is None:
@@ -52,7 +54,8 @@ class ScrapingConfig:
             output_dir=output_dir,
             upload_to_gdrive=upload_to_gdrive,
             gdrive_folder_id=gdrive_folder_id,
-            force_rescrape=force_rescrape
+            force_rescrape=force_rescrape,
+            concurrency=concurrency
         )
     
     @classmethod
@@ -64,7 +67,8 @@ class ScrapingConfig:
         output_dir: str = "scraped_data",
         upload_to_gdrive: bool = False,
         gdrive_folder_id: Optional[str] = None,
-        force_rescrape: bool = False
+        force_rescrape: bool = False,
+        concurrency: int = 1
     ) -> 'ScrapingConfig':
         """Create configuration for backfill operation."""
         if divisions is None:
@@ -79,5 +83,6 @@ class ScrapingConfig:
             output_dir=output_dir,
             upload_to_gdrive=upload_to_gdrive,
             gdrive_folder_id=gdrive_folder_id,
-            force_rescrape=force_rescrape
+            force_rescrape=force_rescrape,
+            concurrency=concurrency
         )
@@ -3,5 +3,6 @@
 from .base_scraper import BaseScraper
 from .ncaa_scraper import NCAAScraper
 from .selenium_utils import SeleniumUtils
+from .driver_pool import DriverPool
 
-__all__ = ['BaseScraper', 'NCAAScraper', 'SeleniumUtils']
+__all__ = ['BaseScraper', 'NCAAScraper', 'SeleniumUtils', 'DriverPool']
@@ -0,0 +1,125 @@
+"""Pool of reusable Chrome drivers for the NCAA scraper."""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from selenium import webdriver
+
+from .selenium_utils import SeleniumUtils
+
+logger = logging.getLogger(__name__)
+
+# Restart Chrome after this many games even if it still responds, so memory
+# the browser leaks over a long session does not build up
+DRIVER_RECYCLE_INTERVAL = 20
+
+
+class DriverPool:
+    """
+    Keeps Chrome drivers alive between uses instead of restarting Chrome.
+    
+    Drivers are created lazily, up to ``size`` at a time. A driver handed
+    back with release() is reused if it still responds, and replaced on the
+    next acquire() otherwise.
+    """
+    
+    def __init__(self, size: int = 1, headless: bool = True, max_retries: int = 3):
+        self.size = size
+        self.headless = headless
+        self.max_retries = max_retries
+        self._idle: queue.Queue = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def is_alive(driver: webdriver.Chrome) -> bool:
+        """
+        Check that a driver's browser session still responds.
+        
+        Args:
+            driver: WebDriver instance to check
+        
+        Returns:
+            True if the driver answered a trivial script, False otherwise
+        """
+        if not driver or not driver.session_id:
+            return False
+        try:
+            return SeleniumUtils.safe_driver_operation(
+                driver,
+                lambda: driver.execute_script("return 1"),
+                timeout=5,
+                operation_name="driver health check"
+            ) == 1
+        except Exception:
+            return False
+    
+    def acquire(self) -> webdriver.Chrome:
+        """
+        Take a driver from the pool, creating one if the pool is not full.
+        
+        Blocks until a driver is released when all drivers are in use.
+        
+        Returns:
+            Chrome WebDriver
+        
+        Raises:
+            SessionNotCreatedException: If a new driver could not be created
+        """
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    break
+            
+            # Poll so a slot freed by a discarded driver is noticed too
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+        
+        try:
+            return SeleniumUtils.create_driver(headless=self.headless, max_retries=self.max_retries)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+    
+    def release(self, driver: webdriver.Chrome):
+        """
+        Return a driver to the pool, quitting it instead if it stopped responding.
+        
+        Args:
+            driver: WebDriver previously returned by acquire()
+        """
+        if self.is_alive(driver):
+            self._idle.put(driver)
+            return
+        
+        logger.info("Discarding unresponsive driver from pool")
+        SeleniumUtils.safe_quit_driver(driver)
+        with self._lock:
+            self._created -= 1
+    
+    def close(self):
+        """Quit every idle driver in the pool, side by side rather than one after another."""
+        drivers: List[webdriver.Chrome] = []
+        while True:
+            try:
+                drivers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        
+        if drivers:
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                list(executor.map(SeleniumUtils.safe_quit_driver, drivers))
+        with self._lock:
+            self._created -= len(drivers)
@@ -0,0 +1,65 @@
+"""Plain HTTP page fetching for the NCAA scraper."""
+
+import logging
+from typing import Callable, Optional
+
+import requests
+
+from ..config.constants import USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+
+class HttpPageFetcher:
+    """
+    Fetches pages with a plain HTTP client instead of a browser.
+
+    Pages that come back without the content a caller needs (bot checks,
+    JavaScript-rendered pages, errors) count as misses. After max_misses
+    misses in a row the fetcher disables itself, so callers fall back to
+    Selenium without paying for a request that is bound to fail.
+    """
+
+    def __init__(self, timeout: int = 30, max_misses: int = 3):
+        self.timeout = timeout
+        self.max_misses = max_misses
+        self.misses = 0
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the fetcher is still worth trying."""
+        return self.misses < self.max_misses
+
+    def fetch(self, url: str, is_complete: Callable[[str], bool]) -> Optional[str]:
+        """
+        Fetch a page's HTML.
+
+        Args:
+            url: URL to fetch
+            is_complete: Returns True if the HTML has everything the caller needs
+
+        Returns:
+            The page HTML, or None if the fetcher is disabled or the page was incomplete
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code == 200 and is_complete(response.text):
+                self.misses = 0
+                return response.text
+            logger.debug("HTTP fetch of %s was incomplete (status %s)", url, response.status_code)
+        except requests.RequestException as e:
+            logger.debug("HTTP fetch of %s failed: %s", url, e)
+
+        self.misses += 1
+        if not self.enabled:
+            logger.info(f"Plain HTTP fetches failed {self.misses} times in a row, using the browser only")
+        return None
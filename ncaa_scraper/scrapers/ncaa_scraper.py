@@ -15,12 +15,28 @@ import re
 
 from .base_scraper import BaseScraper
 from .selenium_utils import SeleniumUtils
+from .driver_pool import DriverPool, DRIVER_RECYCLE_INTERVAL
 from ..models import GameData, TeamData
 from ..utils import parse_url_components, extract_game_id_from_url
 from ..config.constants import ErrorType
+from .http_fetcher import HttpPageFetcher
 
 logger = logging.getLogger(__name__)
 
+# Opening tag of a team's stat table, as served in a game's individual stats page
+_STAT_TABLE_TAG_RE = re.compile(r'<table[^>]*\bid="competitor_\d+_year_stat_category_0_data_table"')
+# id of a team's stat table, and of a player row inside it
+_STAT_TABLE_ID_RE = re.compile(r'competitor_\d+_year_stat_category_0_data_table')
+_PLAYER_ROW_ID_RE = re.compile(r'game_player_\d+_year_stat_category_0')
+# Box score links on the scoreboard, and the contest ID inside them
+_BOX_SCORE_HREF_RE = re.compile(r'/contests/\d+/box_score')
+_CONTEST_ID_RE = re.compile(r'/contests/(\d+)/')
+
+
+def _has_both_stat_tables(html: str) -> bool:
+    """Whether a game page's HTML already contains both teams' stat tables."""
+    return len(_STAT_TABLE_TAG_RE.findall(html)) >= 2
+
 
 class NCAAScraper(BaseScraper):
     """NCAA basketball box score scraper."""
@@ -28,6 +44,46 @@ class NCAAScraper(BaseScraper):
     def __init__(self, config):
         super().__init__(config)
         self.driver: Optional[webdriver.Chrome] = None
+        self.driver_pool: Optional[DriverPool] = None
+        self._holds_pool_driver = False
+        # Google Drive existence by (year, month, day, gender, division), filled by the pre-check
+        self.gdrive_existing: Dict[tuple, bool] = {}
+        self.http_fetcher = HttpPageFetcher()
+        # (year, month, gender, division) of CSVs with queued duplicate flags, for re-uploading them
+        self._flagged_csvs: Dict[str, tuple] = {}
+    
+    def _acquire_driver(self):
+        """Set self.driver from the driver pool, or create a new driver if there is none."""
+        if self.driver_pool:
+            self.driver = self.driver_pool.acquire()
+            self._holds_pool_driver = True
+        else:
+            self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+    
+    def _release_driver(self):
+        """Hand self.driver back to the driver pool, or quit it if it did not come from one."""
+        if self._holds_pool_driver:
+            # Released even if recreating it failed, so the pool frees the slot
+            self.driver_pool.release(self.driver)
+            self._holds_pool_driver = False
+        elif self.driver:
+            SeleniumUtils.safe_quit_driver(self.driver)
+        self.driver = None
+    
+    def flush_duplicate_flags(self):
+        """
+        Write queued duplicate flags to earlier divisions' CSVs, then re-upload them.
+        
+        Each flagged CSV is rewritten and uploaded once, however many of its
+        games turned out to be cross-division duplicates.
+        """
+        for csv_path in self.csv_handler.materialize_duplicate_flags():
+            location = self._flagged_csvs.get(csv_path)
+            if self.config.upload_to_gdrive and location:
+                year, month, gender, division = location
+                self.logger.info(f"Uploading updated CSV with duplicate flags to Google Drive: {csv_path}")
+                self.upload_to_gdrive(csv_path, year, month, gender, division)
+        self._flagged_csvs.clear()
     
     def scrape(self, url: str) -> List[GameData]:
         """
@@ -60,9 +116,11 @@ class NCAAScraper(BaseScraper):
             # Check if data already exists in Google Drive (if enabled)
             # Skip this check if force_rescrape is enabled
             if self.config.upload_to_gdrive and not getattr(self, 'force_rescrape', False):
-                gdrive_exists, gdrive_file_id = self.google_drive.check_file_exists_in_gdrive(
-                    year, month, gender, division, day
-                )
+                gdrive_exists = self.gdrive_existing.get((year, month, day, gender, division))
+                if gdrive_exists is None:
+                    gdrive_exists, gdrive_file_id = self.google_drive.check_file_exists_in_gdrive(
+                        year, month, gender, division, day
+                    )
                 if gdrive_exists:
                     self.logger.info(f"Data for {gender} {division} on {year}-{month}-{day} already exists in Google Drive, skipping...")
                     return []
@@ -71,7 +129,7 @@ class NCAAScraper(BaseScraper):
             
             # Initialize driver with retry mechanism
             try:
-                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+                self._acquire_driver()
             except Exception as e:
                 error_msg = f"Failed to initialize WebDriver: {e}"
                 self.logger.error(error_msg)
@@ -131,53 +189,57 @@ class NCAAScraper(BaseScraper):
                 
                 # Scrape each game
                 scraped_games = []
-                for idx, game_link in enumerate(new_links):
-                    try:
-                        # Recreate driver every 20 games to prevent memory/resource buildup
-                        if idx > 0 and idx % 20 == 0:
-                            self.logger.info(f"Recreating driver after {idx} games to prevent resource buildup...")
-                            try:
-                                # Aggressive cleanup before recreating
-                                SeleniumUtils._cleanup_driver_resources()
-                                SeleniumUtils.safe_quit_driver(self.driver)
-                            except Exception as e:
-                                self.logger.warning(f"Error quitting old driver: {e}")
-                            
-                            # Wait a bit for processes to fully terminate
-                            time.sleep(3)
-                            
-                            # Create new driver
-                            try:
-                                self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                            except Exception as e:
-                                self.logger.error(f"Failed to recreate driver: {e}")
-                                # Try once more with longer cleanup
-                                SeleniumUtils._cleanup_driver_resources()
-                                time.sleep(5)
+                driver_suspect = False
+                with self.csv_handler.appending(csv_path):
+                    for idx, game_link in enumerate(new_links):
+                        try:
+                            # Recreate the driver periodically, or after an error if it stopped responding
+                            recycle = idx > 0 and idx % DRIVER_RECYCLE_INTERVAL == 0
+                            if recycle or (driver_suspect and not DriverPool.is_alive(self.driver)):
+                                self.logger.info("Recreating driver after %d games...", idx)
+                                try:
+                                    # Aggressive cleanup before recreating
+                                    SeleniumUtils._cleanup_driver_resources()
+                                    SeleniumUtils.safe_quit_driver(self.driver)
+                                except Exception as e:
+                                    self.logger.warning(f"Error quitting old driver: {e}")
+                                
+                                # Create new driver
                                 try:
                                     self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                                except Exception as e2:
-                                    self.logger.error(f"Failed to recreate driver after cleanup: {e2}")
-                                    return scraped_games  # Return what we have so far
-                        
-                        game_data = self._scrape_single_game(
-                            game_link, year, month, day, gender, division, csv_path
-                        )
-                        if game_data:
-                            scraped_games.append(game_data)
-                            # Update visited_links with current division
-                            self.visited_links[game_link] = division
-                    except Exception as e:
-                        self.logger.error(f"Error scraping game {game_link}: {e}")
-                        self.send_notification(
-                            f"Error scraping game: {e}",
-                            ErrorType.GAME_ERROR,
-                            division=division,
-                            date=f"{year}-{month}-{day}",
-                            gender=gender,
-                            game_link=game_link
-                        )
-                        continue
+                                except Exception as e:
+                                    self.logger.error(f"Failed to recreate driver: {e}")
+                                    # Try once more with longer cleanup
+                                    SeleniumUtils._cleanup_driver_resources()
+                                    time.sleep(5)
+                                    try:
+                                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+                                    except Exception as e2:
+                                        self.logger.error(f"Failed to recreate driver after cleanup: {e2}")
+                                        return scraped_games  # Return what we have so far
+                            driver_suspect = False
+                            
+                            game_data = self._scrape_single_game(
+                                game_link, year, month, day, gender, division, csv_path
+                            )
+                            if game_data:
+                                scraped_games.append(game_data)
+                                # Update visited_links with current division
+                                self.visited_links[game_link] = division
+                        except Exception as e:
+                            self.logger.error(f"Error scraping game {game_link}: {e}")
+                            driver_suspect = True
+                            self.send_notification(
+                                f"Error scraping game: {e}",
+                                ErrorType.GAME_ERROR,
+                                division=division,
+                                date=f"{year}-{month}-{day}",
+                                gender=gender,
+                                game_link=game_link
+                            )
+                            continue
+                
+                self.flush_duplicate_flags()
                 
                 # Upload to Google Drive if enabled
                 if self.config.upload_to_gdrive and self.file_manager.file_exists_and_has_content(csv_path):
@@ -187,9 +249,7 @@ class NCAAScraper(BaseScraper):
                 return scraped_games
                 
             finally:
-                if self.driver:
-                    SeleniumUtils.safe_quit_driver(self.driver)
-                    self.driver = None
+                self._release_driver()
                     
         except Exception as e:
             self.logger.error(f"Unexpected error in scrape method: {e}")
@@ -400,7 +460,7 @@ class NCAAScraper(BaseScraper):
             try:
                 # Wait for body to be present (stats.ncaa.org structure)
                 wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                time.sleep(2)  # Additional wait for content to load
+                SeleniumUtils.wait_for_page_ready(self.driver)
                 return True
             except TimeoutException:
                 # Check if page loaded but just has no games
@@ -522,7 +582,7 @@ class NCAAScraper(BaseScraper):
                 try:
                     wait = WebDriverWait(self.driver, self.config.wait_timeout)
                     wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    time.sleep(2)  # Additional wait for content
+                    SeleniumUtils.wait_for_page_ready(self.driver)
                 except TimeoutException:
                     if attempt < max_retries - 1:
                         self.logger.warning(f"Page not ready, retrying...")
@@ -564,11 +624,11 @@ class NCAAScraper(BaseScraper):
                                 continue
                             
                             # Find box score link
-                            box_score_link_elem = table.find('a', href=re.compile(r'/contests/\d+/box_score'))
+                            box_score_link_elem = table.find('a', href=_BOX_SCORE_HREF_RE)
                             if box_score_link_elem:
                                 box_score_path = box_score_link_elem.get('href', '')
                                 # Convert to individual_stats URL
-                                contest_id_match = re.search(r'/contests/(\d+)/', box_score_path)
+                                contest_id_match = _CONTEST_ID_RE.search(box_score_path)
                                 if contest_id_match:
                                     contest_id = contest_id_match.group(1)
                                     # Only add if we haven't seen this contest ID before
@@ -660,7 +720,7 @@ class NCAAScraper(BaseScraper):
         
         # Check if game already exists in CSV
         if self.is_duplicate(game_id, csv_path):
-            self.logger.info(f"Game {game_id} already exists in {csv_path}, skipping...")
+            self.logger.info("Game %s already exists in %s, skipping...", game_id, csv_path)
             return None
         
         # Check if already visited in this session
@@ -668,11 +728,11 @@ class NCAAScraper(BaseScraper):
             previous_division = self.visited_links[game_link]
             if previous_division == division:
                 # Same division - skip
-                self.logger.info(f"Game link {game_link} already visited in this session for {division}, skipping...")
+                self.logger.info("Game link %s already visited in this session for %s, skipping...", game_link, division)
                 return None
             else:
                 # Different division - reuse existing data instead of rescraping
-                self.logger.info(f"Game link {game_link} already scraped in {previous_division}, reusing existing data for {division}")
+                self.logger.info("Game link %s already scraped in %s, reusing existing data for %s", game_link, previous_division, division)
                 
                 # Get the CSV path for the previous division
                 previous_csv_path = self.file_manager.get_csv_path(year, month, day, gender, previous_division)
@@ -681,12 +741,10 @@ class NCAAScraper(BaseScraper):
                 existing_game_data = self.csv_handler.get_game_data_by_link(previous_csv_path, game_link)
                 
                 if existing_game_data is not None and not existing_game_data.empty:
-                    # Update the previous division's CSV to mark it as duplicate
-                    if self.csv_handler.update_duplicate_flag(previous_csv_path, game_link, duplicate_value=True):
-                        # Upload updated CSV to Google Drive if enabled
-                        if self.config.upload_to_gdrive:
-                            self.logger.info(f"Uploading updated CSV with duplicate flag to Google Drive: {previous_csv_path}")
-                            self.upload_to_gdrive(previous_csv_path, year, month, gender, previous_division)
+                    # Mark it as duplicate in the previous division's CSV; written (and
+                    # re-uploaded) once per file by flush_duplicate_flags()
+                    self.csv_handler.queue_duplicate_flag(previous_csv_path, game_link, duplicate_value=True)
+                    self._flagged_csvs[previous_csv_path] = (year, month, gender, previous_division)
                     
                     # Copy the data to current division's CSV with duplicate flag set
                     existing_game_data = existing_game_data.copy()
@@ -699,7 +757,7 @@ class NCAAScraper(BaseScraper):
                     
                     # Append to current division's CSV
                     if self.csv_handler.append_game_data(csv_path, existing_game_data):
-                        self.logger.info(f"Successfully copied game data from {previous_division} to {division} CSV")
+                        self.logger.info("Successfully copied game data from %s to %s CSV", previous_division, division)
                         # Update visited_links with current division
                         self.visited_links[game_link] = division
                         return None  # Return None since we didn't create new GameData
@@ -710,103 +768,23 @@ class NCAAScraper(BaseScraper):
                     self.logger.warning(f"Could not find existing game data in {previous_division} CSV, will scrape instead")
                     # Fall through to scrape it
         
-        self.logger.info(f"Scraping: {game_link}")
+        self.logger.info("Scraping: %s", game_link)
         
         try:
-            # Navigate to individual stats page with timeout handling
-            try:
-                load_success = SeleniumUtils.safe_driver_operation(
-                    self.driver,
-                    lambda: self.driver.get(game_link),
-                    timeout=90,
-                    operation_name=f"load individual stats page {game_link}"
-                )
-                
-                if load_success is None:
-                    self.logger.warning(f"Page load hung for game {game_link}, attempting recovery...")
-                    try:
-                        SeleniumUtils.safe_driver_operation(
-                            self.driver,
-                            lambda: self.driver.execute_script("window.stop();"),
-                            timeout=5,
-                            operation_name="stop page load"
-                        )
-                        time.sleep(3)
-                    except Exception:
-                        self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
-                        return None
-                else:
-                    self.logger.info(f"Successfully navigated to: {game_link}")
-                    time.sleep(2)
-                    
-            except TimeoutException:
-                self.logger.warning(f"Page load timeout for game {game_link}, attempting recovery...")
-                try:
-                    SeleniumUtils.safe_driver_operation(
-                        self.driver,
-                        lambda: self.driver.execute_script("window.stop();"),
-                        timeout=5,
-                        operation_name="stop page load"
-                    )
-                    time.sleep(3)
-                except Exception:
-                    self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
-                    return None
-            except Exception as e:
-                error_str = str(e)
-                if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
-                    self.logger.error(f"Driver frozen/unresponsive during page load for {game_link}: {e}")
-                    try:
-                        SeleniumUtils._cleanup_driver_resources()
-                        SeleniumUtils.safe_quit_driver(self.driver)
-                    except Exception as e2:
-                        self.logger.warning(f"Error during cleanup: {e2}")
-                    
-                    time.sleep(5)
-                    
-                    try:
-                        self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
-                    except Exception as e2:
-                        self.logger.error(f"Failed to recreate driver: {e2}")
-                        return None
+            # A plain HTTP fetch is far cheaper than the browser when the page is server-rendered
+            html = self.http_fetcher.fetch(game_link, _has_both_stat_tables)
+            if html:
+                self.logger.info("Fetched %s over HTTP", game_link)
+            else:
+                html = self._load_game_page_source(game_link)
+                if not html:
                     return None
-                else:
-                    raise
-            
-            # Wait for stat tables to actually appear in the DOM
-            wait = WebDriverWait(self.driver, self.config.wait_timeout)
-            try:
-                # Wait for at least one stat table to appear
-                wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "table[id*='competitor_'][id*='_year_stat_category_0_data_table']")
-                    )
-                )
-                # Give it a moment for the second table to load
-                time.sleep(2)
-                self.logger.debug(f"Stat tables found in DOM for {game_link}")
-            except TimeoutException:
-                self.logger.warning(f"Stat tables not found in DOM for {game_link} after waiting, page may not be loaded properly")
-                # Still try to get page source in case tables are there but selector didn't match
-            
-            # Get page source and parse with BeautifulSoup
-            html = SeleniumUtils.safe_driver_operation(
-                self.driver,
-                lambda: self.driver.page_source,
-                timeout=30,
-                default_return="",
-                operation_name="get page source for parsing"
-            )
-            
-            if not html:
-                self.logger.warning(f"Could not get page source for {game_link}")
-                return None
             
             # Parse individual stats using BeautifulSoup (like altscraper.py)
             soup = BeautifulSoup(html, 'html.parser')
             
             # Find all stat tables (one for each team)
-            stat_tables = soup.find_all('table', id=re.compile(r'competitor_\d+_year_stat_category_0_data_table'))
+            stat_tables = soup.find_all('table', id=_STAT_TABLE_ID_RE)
             
             if len(stat_tables) < 2:
                 error_msg = f"Could not find both team stat tables for {game_link}"
@@ -897,7 +875,7 @@ class NCAAScraper(BaseScraper):
                 if not tbody:
                     continue
                     
-                player_rows = tbody.find_all('tr', id=re.compile(r'game_player_\d+_year_stat_category_0'))
+                player_rows = tbody.find_all('tr', id=_PLAYER_ROW_ID_RE)
                 
                 # Skip the last row (usually team totals/team name row)
                 if len(player_rows) > 0:
@@ -1046,7 +1024,7 @@ class NCAAScraper(BaseScraper):
             
             # Save to CSV
             if self.save_game_data(game_data, csv_path):
-                self.logger.info(f"Successfully saved game data for {game_id}")
+                self.logger.info("Successfully saved game data for %s", game_id)
                 return game_data
             else:
                 self.logger.error(f"Failed to save game data for {game_id}")
@@ -1088,6 +1066,108 @@ class NCAAScraper(BaseScraper):
                 )
                 return None
     
+    def _load_game_page_source(self, game_link: str) -> Optional[str]:
+        """
+        Load a game's individual stats page in the browser and return its HTML.
+        
+        Args:
+            game_link: URL of the game's individual stats page
+        
+        Returns:
+            Page HTML, or None if the page could not be loaded
+        """
+        # Navigate to individual stats page with timeout handling
+        try:
+            load_success = SeleniumUtils.safe_driver_operation(
+                self.driver,
+                lambda: self.driver.get(game_link),
+                timeout=90,
+                operation_name=f"load individual stats page {game_link}"
+            )
+            
+            if load_success is None:
+                self.logger.warning(f"Page load hung for game {game_link}, attempting recovery...")
+                try:
+                    SeleniumUtils.safe_driver_operation(
+                        self.driver,
+                        lambda: self.driver.execute_script("window.stop();"),
+                        timeout=5,
+                        operation_name="stop page load"
+                    )
+                    time.sleep(3)
+                except Exception:
+                    self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
+                    return None
+            else:
+                self.logger.info("Successfully navigated to: %s", game_link)
+                
+        except TimeoutException:
+            self.logger.warning(f"Page load timeout for game {game_link}, attempting recovery...")
+            try:
+                SeleniumUtils.safe_driver_operation(
+                    self.driver,
+                    lambda: self.driver.execute_script("window.stop();"),
+                    timeout=5,
+                    operation_name="stop page load"
+                )
+                time.sleep(3)
+            except Exception:
+                self.logger.error(f"Driver unresponsive for {game_link}, skipping...")
+                return None
+        except Exception as e:
+            error_str = str(e)
+            if "HTTPConnectionPool" in error_str or "Read timed out" in error_str:
+                self.logger.error(f"Driver frozen/unresponsive during page load for {game_link}: {e}")
+                try:
+                    SeleniumUtils._cleanup_driver_resources()
+                    SeleniumUtils.safe_quit_driver(self.driver)
+                except Exception as e2:
+                    self.logger.warning(f"Error during cleanup: {e2}")
+                
+                time.sleep(5)
+                
+                try:
+                    self.driver = SeleniumUtils.create_driver(headless=True, max_retries=3)
+                except Exception as e2:
+                    self.logger.error(f"Failed to recreate driver: {e2}")
+                    return None
+                return None
+            else:
+                raise
+        
+        # Wait for stat tables to actually appear in the DOM
+        wait = WebDriverWait(self.driver, self.config.wait_timeout)
+        try:
+            # Wait for at least one stat table to appear
+            stat_table_selector = "table[id*='competitor_'][id*='_year_stat_category_0_data_table']"
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, stat_table_selector)))
+            # Give the second team's table a moment to load, returning as soon as it does
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, stat_table_selector)) >= 2
+                )
+            except TimeoutException:
+                self.logger.debug("Only one stat table found for %s", game_link)
+            self.logger.debug("Stat tables found in DOM for %s", game_link)
+        except TimeoutException:
+            self.logger.warning(f"Stat tables not found in DOM for {game_link} after waiting, page may not be loaded properly")
+            # Still try to get page source in case tables are there but selector didn't match
+        
+        # Get page source and parse with BeautifulSoup
+        html = SeleniumUtils.safe_driver_operation(
+            self.driver,
+            lambda: self.driver.page_source,
+            timeout=30,
+            default_return="",
+            operation_name="get page source for parsing"
+        )
+        
+        if not html:
+            self.logger.warning(f"Could not get page source for {game_link}")
+            return None
+        
+        return html
+    
     def _convert_minutes_to_decimal(self, min_text: str) -> float:
         """Convert minutes from 'MM:SS' format to decimal (e.g., '31:36' -> 31.6)."""
         try:
@@ -15,12 +15,21 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, WebDriverException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 
+from ..config.constants import USER_AGENT
+
 logger = logging.getLogger(__name__)
 
+# Stylesheets and web fonts, blocked over CDP since Chrome has no content setting for them
+BLOCKED_RESOURCE_URLS = ["*.css", "*.css?*", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+
 
 class SeleniumUtils:
     """Utility class for Selenium operations."""
     
+    # Set while several drivers run side by side (see main --concurrency);
+    # cleanup then must not kill other drivers' Chrome processes
+    parallel_drivers = False
+    
     @staticmethod
     def create_driver(headless: bool = False, max_retries: int = 3) -> webdriver.Chrome:
         """
@@ -47,6 +56,10 @@ class SeleniumUtils:
                 if headless or os.getenv('DOCKER_CONTAINER', 'false').lower() == 'true':
                     options.add_argument("--headless=new")
                 
+                # Return from get() once the DOM is parsed instead of after every subresource
+                options.page_load_strategy = 'eager'
+                options.set_capability('goog:loggingPrefs', {'browser': 'OFF', 'performance': 'OFF'})
+                
                 # Essential Chrome options for stability and anti-detection
                 options.add_argument("--no-sandbox")
                 options.add_argument("--disable-dev-shm-usage")
@@ -64,7 +77,8 @@ class SeleniumUtils:
                 options.add_argument("--ignore-certificate-errors")
                 options.add_argument("--ignore-ssl-errors")
                 options.add_argument("--allow-running-insecure-content")
-                options.add_argument("--remote-debugging-port=9222")
+                # A fixed port would collide between drivers running in parallel
+                options.add_argument("--remote-debugging-port=0" if SeleniumUtils.parallel_drivers else "--remote-debugging-port=9222")
                 options.add_argument("--disable-blink-features=AutomationControlled")
                 options.add_argument("--disable-logging")
                 options.add_argument("--disable-default-apps")
@@ -94,7 +108,7 @@ class SeleniumUtils:
                 options.add_argument("--enable-automation")
                 
                 # Anti-detection measures
-                options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+                options.add_argument(f"--user-agent={USER_AGENT}")
                 options.add_argument("--accept-language=en-US,en;q=0.9")
                 options.add_argument("--accept-encoding=gzip, deflate, br")
                 options.add_argument("--accept=text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8")
@@ -111,6 +125,8 @@ class SeleniumUtils:
                 options.add_experimental_option('useAutomationExtension', False)
                 
                 # Additional anti-detection measures
+                # Scraping only reads the DOM, so skip images (stylesheets and fonts are blocked below)
+                options.add_argument("--blink-settings=imagesEnabled=false")
                 prefs = {
                     "profile.default_content_setting_values": {
                         "notifications": 2,
@@ -118,7 +134,7 @@ class SeleniumUtils:
                         "media_stream": 2,
                     },
                     "profile.managed_default_content_settings": {
-                        "images": 1
+                        "images": 2
                     }
                 }
                 options.add_experimental_option("prefs", prefs)
@@ -168,6 +184,13 @@ class SeleniumUtils:
                     logger.warning(f"Error setting anti-detection properties: {e}")
                     # Continue anyway - these are nice-to-have
                 
+                # Waits only check element presence, so pages work without styles or fonts
+                try:
+                    driver.execute_cdp_cmd("Network.enable", {})
+                    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+                except Exception as e:
+                    logger.warning(f"Error blocking stylesheets and fonts: {e}")
+                
                 # Test the driver
                 try:
                     driver.get("about:blank")
@@ -202,6 +225,10 @@ class SeleniumUtils:
     @staticmethod
     def _cleanup_driver_resources():
         """Clean up driver-related resources and processes."""
+        if SeleniumUtils.parallel_drivers:
+            logger.debug("Skipping Chrome process cleanup while drivers run in parallel")
+            return
+        
         try:
             # Kill any existing Chrome processes FIRST (before trying to quit driver)
             if os.name == 'nt':  # Windows
@@ -325,7 +352,7 @@ class SeleniumUtils:
                             operation_name="close window"
                         )
                     except Exception as e:
-                        logger.debug(f"Error closing window {handle}: {e}")
+                        logger.debug("Error closing window %s: %s", handle, e)
                         pass  # Continue with other windows
             
             # Quit driver with timeout protection
@@ -347,6 +374,31 @@ class SeleniumUtils:
             except Exception:
                 return False
     
+    @staticmethod
+    def wait_for_page_ready(driver: webdriver.Chrome, timeout: int = 5) -> bool:
+        """
+        Wait for the current page's DOM to be ready.
+        
+        Polls document.readyState instead of sleeping a fixed time, so it
+        returns as soon as the document has been parsed. Drivers use the
+        eager page load strategy, so subresources may still be loading.
+        
+        Args:
+            driver: WebDriver instance
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if the page's DOM is ready, False on timeout
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+            return True
+        except (TimeoutException, WebDriverException):
+            logger.debug("Page not ready after %s seconds", timeout)
+            return False
+    
     @staticmethod
     def wait_for_element(driver: webdriver.Chrome, by: By, value: str, timeout: int = 15) -> Optional[object]:
         """
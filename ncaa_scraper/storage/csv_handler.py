@@ -1,18 +1,103 @@
 """CSV handling utilities for the NCAA scraper."""
 
+import csv
+import mmap
 import os
+import shutil
+import numpy as np
 import pandas as pd
 import logging
-from typing import Optional, Set
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
+# Bytes of appended rows to buffer per CSV inside appending() before writing them out
+APPEND_BUFFER_SIZE = 64 * 1024
+
+# Rows of the new CSV to hold in memory at once when stream-merging
+MERGE_CHUNK_ROWS = 100_000
+
+# Types of the identifying columns, so reads don't infer them (GAMEID would otherwise become an int)
+CSV_COLUMN_DTYPES = {
+    'GAMEID': 'string',
+    'TEAM': 'string',
+    'OPP': 'string',
+    'GAMELINK': 'string',
+    'DUPLICATE_ACROSS_DIVISIONS': 'boolean',
+}
+
+
+def _write_csv(df: pd.DataFrame, csv_path: str) -> None:
+    """
+    Atomically replace a CSV file with a DataFrame's contents.
+    
+    The rows go to a temporary file next to csv_path, which is synced and
+    renamed over it, so a crash mid-write never leaves a torn file.
+    """
+    tmp_path = csv_path + '.tmp'
+    try:
+        df.to_csv(tmp_path, index=False)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _distinct_game_ids(df: pd.DataFrame) -> List[str]:
+    """
+    Get a DataFrame's distinct GAMEIDs as plain Python strings.
+    
+    A game's rows all share one GAMEID, so unique() shrinks the column to a
+    handful of values before they are converted to a list in one call,
+    instead of iterating the Series element by element.
+    """
+    if 'GAMEID' not in df.columns:
+        return []
+    return df['GAMEID'].dropna().astype(str).unique().tolist()
+
+
+def _copy_unchanged(src_path: str, dst_path: str) -> None:
+    """
+    Make dst_path hold exactly the bytes of src_path without re-serializing them.
+    
+    Hard-links when possible and falls back to a plain file copy (e.g. when
+    dst_path already exists or is on another filesystem).
+    """
+    if os.path.abspath(src_path) == os.path.abspath(dst_path):
+        return
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
 
 class CSVHandler:
     """Handles CSV file operations for game data."""
     
     def __init__(self, file_manager):
         self.file_manager = file_manager
+        # Rows grouped by GAMELINK per CSV path, with the (mtime, size) they were read at
+        self._rows_by_link: Dict[str, Tuple[Tuple[int, int], Dict[str, pd.DataFrame]]] = {}
+        # Open append handles for CSV paths inside appending() blocks (None until first write)
+        self._append_handles: Dict[str, Optional[BinaryIO]] = {}
+        # Serialized rows not yet written through those handles, and whether the file still needs a header
+        self._append_buffers: Dict[str, List[bytes]] = {}
+        self._append_needs_header: Dict[str, bool] = {}
+        # GAMEIDs per CSV path, with the (mtime, size) they are current for
+        self._game_ids: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+        # DUPLICATE_ACROSS_DIVISIONS values by game link per CSV path, not yet written
+        self._pending_duplicate_flags: Dict[str, Dict[str, bool]] = {}
     
     def game_exists_in_csv(self, csv_path: str, game_id: str) -> bool:
         """
@@ -25,17 +110,18 @@ class CSVHandler:
         Returns:
             True if game exists, False otherwise
         """
-        if not os.path.exists(csv_path):
-            return False
+        game_id = str(game_id)
+        game_ids = self._cached_game_ids(csv_path)
+        if game_ids is not None:
+            return game_id in game_ids
         
-        try:
-            df = pd.read_csv(csv_path)
-            if 'GAMEID' in df.columns:
-                return game_id in df['GAMEID'].values
-            return False
-        except Exception as e:
-            logger.warning(f"Error reading CSV file {csv_path}: {e}")
+        # Inside appending() the scraper checks every game, so build the set once below;
+        # for a one-off check a raw byte scan is cheaper than parsing the whole file
+        if csv_path not in self._append_handles and not self._file_contains(csv_path, game_id.encode('utf-8')):
+            # The search is for the bare ID, not a delimited field, so it also matches a quoted
+            # GAMEID ("123"); IDs need no escaping, so a miss means the game is not in the file
             return False
+        return game_id in self.get_existing_game_ids(csv_path)
     
     def append_game_data(self, csv_path: str, game_data_df: pd.DataFrame) -> bool:
         """
@@ -49,18 +135,86 @@ class CSVHandler:
             True if successful, False otherwise
         """
         try:
-            file_exists = os.path.exists(csv_path)
-            game_data_df.to_csv(csv_path, index=False, header=not file_exists, mode='a')
-            logger.info(f"Successfully saved {len(game_data_df)} rows to: {csv_path}")
+            if csv_path in self._append_handles:
+                if self._append_handles[csv_path] is None:
+                    f = self._append_handles[csv_path] = open(csv_path, 'ab')
+                    self._append_needs_header[csv_path] = os.fstat(f.fileno()).st_size == 0
+                
+                # Serialize now, write later: rows are buffered until enough have
+                # built up, the file is read, or the appending() block ends
+                buffer = self._append_buffers.setdefault(csv_path, [])
+                buffer.append(game_data_df.to_csv(index=False, header=self._append_needs_header[csv_path]).encode('utf-8'))
+                self._append_needs_header[csv_path] = False
+                if sum(len(chunk) for chunk in buffer) >= APPEND_BUFFER_SIZE:
+                    self._flush_appends(csv_path)
+            else:
+                file_exists = os.path.exists(csv_path)
+                game_data_df.to_csv(csv_path, index=False, header=not file_exists, mode='a')
+            self._add_cached_game_ids(csv_path, game_data_df)
+            logger.info("Successfully saved %d rows to: %s", len(game_data_df), csv_path)
             return True
         except Exception as e:
             logger.error(f"Error saving data to {csv_path}: {e}")
             return False
     
+    @contextmanager
+    def appending(self, csv_path: str):
+        """
+        Keep a CSV file open for appends for the duration of the block.
+        
+        append_game_data() then writes through one handle, opened on the first
+        append, instead of reopening the file for every game.
+        
+        Args:
+            csv_path: Path to the CSV file
+        """
+        self._append_handles[csv_path] = None
+        try:
+            yield
+        finally:
+            try:
+                self._flush_appends(csv_path)
+            finally:
+                self._append_buffers.pop(csv_path, None)
+                self._append_needs_header.pop(csv_path, None)
+                f = self._append_handles.pop(csv_path, None)
+                if f is not None:
+                    f.close()
+    
+    def _flush_appends(self, csv_path: str):
+        """
+        Write out rows buffered for a CSV file inside an appending() block.
+        
+        Called before anything reads the file, so reads always see every
+        appended row.
+        
+        Args:
+            csv_path: Path to the CSV file
+        """
+        buffer = self._append_buffers.get(csv_path)
+        if not buffer:
+            return
+        
+        self._append_buffers[csv_path] = []
+        f = self._append_handles[csv_path]
+        # One write of whole rows, so other readers never see a partial line
+        f.write(b''.join(buffer))
+        f.flush()
+        
+        # The cached GAMEID set already includes these rows; restamp it for the new file
+        cached = self._game_ids.get(csv_path)
+        if cached is not None:
+            st = os.fstat(f.fileno())
+            self._game_ids[csv_path] = ((st.st_mtime_ns, st.st_size), cached[1])
+    
     def read_csv_safely(self, csv_path: str) -> Optional[pd.DataFrame]:
         """
         Safely read CSV file.
         
+        Uses pandas' multi-threaded pyarrow engine when pyarrow is installed,
+        falling back to the default parser if it cannot read the file. Known
+        columns are read with the types in CSV_COLUMN_DTYPES.
+        
         Args:
             csv_path: Path to the CSV file
         
@@ -68,9 +222,17 @@ class CSVHandler:
             DataFrame if successful, None otherwise
         """
         try:
+            self._flush_appends(csv_path)
             if not os.path.exists(csv_path):
                 return None
-            return pd.read_csv(csv_path)
+            header = self._read_header(csv_path) or []
+            dtype = {column: CSV_COLUMN_DTYPES[column] for column in header if column in CSV_COLUMN_DTYPES}
+            if pa is not None:
+                try:
+                    return pd.read_csv(csv_path, engine='pyarrow', dtype=dtype)
+                except (pa.ArrowException, ValueError) as e:
+                    logger.debug(f"pyarrow could not read {csv_path}, using pandas: {e}")
+            return pd.read_csv(csv_path, dtype=dtype)
         except Exception as e:
             logger.error(f"Error reading CSV file {csv_path}: {e}")
             return None
@@ -79,16 +241,121 @@ class CSVHandler:
         """
         Get set of existing game IDs from CSV file.
         
+        The set is cached and only re-read when the file's modification time
+        or size changes; appends through append_game_data() update it in
+        place. Callers must not modify the returned set.
+        
         Args:
             csv_path: Path to the CSV file
         
         Returns:
             Set of existing game IDs
         """
-        df = self.read_csv_safely(csv_path)
-        if df is not None and 'GAMEID' in df.columns:
-            return set(df['GAMEID'].values)
-        return set()
+        self._flush_appends(csv_path)
+        try:
+            st = os.stat(csv_path)
+        except OSError:
+            return set()
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._game_ids.get(csv_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        # Only one column is needed, so stream it with the csv module instead of building a DataFrame
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None or 'GAMEID' not in header:
+                    game_ids = set()
+                else:
+                    idx = header.index('GAMEID')
+                    game_ids = {row[idx] for row in reader if len(row) > idx and row[idx]}
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            logger.warning(f"Error reading CSV file {csv_path}: {e}")
+            return set()
+        
+        self._game_ids[csv_path] = (stamp, game_ids)
+        return game_ids
+    
+    def _cached_game_ids(self, csv_path: str) -> Optional[Set[str]]:
+        """
+        Get the cached GAMEID set for a CSV file if it is still current.
+        
+        Args:
+            csv_path: Path to the CSV file
+        
+        Returns:
+            The set get_existing_game_ids() would return without reading the file,
+            or None if it would have to read it
+        """
+        # No flush: the stamp is the on-disk file's as of the last flush, and rows
+        # still buffered in appending() are already in the set
+        cached = self._game_ids.get(csv_path)
+        if cached is None:
+            return None
+        try:
+            st = os.stat(csv_path)
+        except OSError:
+            return None
+        if cached[0] != (st.st_mtime_ns, st.st_size):
+            return None
+        return cached[1]
+    
+    def _file_contains(self, csv_path: str, needle: bytes) -> bool:
+        """
+        Check whether a byte string occurs anywhere in a file.
+        
+        The file is memory-mapped and searched as raw bytes, which is much
+        cheaper than parsing it when only one lookup is needed. A hit only
+        means the bytes occur somewhere, not that they form a whole field.
+        
+        Args:
+            csv_path: Path to the file
+            needle: Bytes to look for
+        
+        Returns:
+            True if the bytes occur in the file or it could not be read, False otherwise
+        """
+        try:
+            with open(csv_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(needle) != -1
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError):
+            # Let the parsing path decide (and log) instead
+            return True
+    
+    def _add_cached_game_ids(self, csv_path: str, game_data_df: pd.DataFrame):
+        """
+        Add just-appended rows to the cached GAMEID set for a CSV file.
+        
+        Args:
+            csv_path: Path to the CSV file that was appended to
+            game_data_df: Rows that were appended
+        """
+        cached = self._game_ids.get(csv_path)
+        if cached is None:
+            return
+        
+        game_ids = cached[1]
+        if csv_path in self._append_handles:
+            # Still buffered; _flush_appends() restamps the entry once the rows are written
+            game_ids.update(_distinct_game_ids(game_data_df))
+            return
+        
+        try:
+            st = os.stat(csv_path)
+        except OSError:
+            del self._game_ids[csv_path]
+            return
+        
+        game_ids.update(_distinct_game_ids(game_data_df))
+        self._game_ids[csv_path] = ((st.st_mtime_ns, st.st_size), game_ids)
     
     def validate_csv_structure(self, csv_path: str) -> bool:
         """
@@ -100,12 +367,13 @@ class CSVHandler:
         Returns:
             True if structure is valid, False otherwise
         """
-        df = self.read_csv_safely(csv_path)
-        if df is None:
+        # Only the column names matter, so don't parse the rows
+        header = self._read_header(csv_path)
+        if header is None:
             return False
         
         required_columns = ['GAMEID', 'TEAM', 'OPP', 'GAMELINK']
-        return all(col in df.columns for col in required_columns)
+        return all(col in header for col in required_columns)
     
     def get_game_data_by_link(self, csv_path: str, game_link: str) -> Optional[pd.DataFrame]:
         """
@@ -118,15 +386,48 @@ class CSVHandler:
         Returns:
             DataFrame with game data rows, or None if not found
         """
-        df = self.read_csv_safely(csv_path)
-        if df is None or 'GAMELINK' not in df.columns:
+        rows_by_link = self._get_rows_by_link(csv_path)
+        if rows_by_link is None:
+            return None
+        
+        game_rows = rows_by_link.get(game_link)
+        if game_rows is None:
+            return None
+        
+        return game_rows.copy()
+    
+    def _get_rows_by_link(self, csv_path: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Get the rows of a CSV file grouped by game link.
+        
+        The grouping is cached and only rebuilt when the file's modification
+        time or size changes, so looking up many games in the same file
+        parses it once.
+        
+        Args:
+            csv_path: Path to the CSV file
+        
+        Returns:
+            Dictionary of game link to rows, or None if the file is missing or has no GAMELINK column
+        """
+        self._flush_appends(csv_path)
+        try:
+            st = os.stat(csv_path)
+        except OSError:
             return None
         
-        game_rows = df[df['GAMELINK'] == game_link].copy()
-        if game_rows.empty:
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._rows_by_link.get(csv_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        df = self.read_csv_safely(csv_path)
+        if df is None or 'GAMELINK' not in df.columns:
             return None
         
-        return game_rows
+        rows_by_link = {game_link: rows for game_link, rows in df.groupby('GAMELINK', sort=False)}
+        self._rows_by_link[csv_path] = (stamp, rows_by_link)
+        return rows_by_link
     
     def update_duplicate_flag(self, csv_path: str, game_link: str, duplicate_value: bool = True) -> bool:
         """
@@ -137,6 +438,53 @@ class CSVHandler:
             game_link: Game link to update
             duplicate_value: Value to set for DUPLICATE_ACROSS_DIVISIONS
         
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._apply_duplicate_flags(csv_path, {game_link: duplicate_value}):
+            return False
+        logger.info(f"Updated DUPLICATE_ACROSS_DIVISIONS flag for game {game_link} in {csv_path}")
+        return True
+    
+    def queue_duplicate_flag(self, csv_path: str, game_link: str, duplicate_value: bool = True):
+        """
+        Record a DUPLICATE_ACROSS_DIVISIONS update to write later.
+        
+        update_duplicate_flag() rewrites the whole file for each game; queued
+        updates are written together by materialize_duplicate_flags(), one
+        rewrite per file.
+        
+        Args:
+            csv_path: Path to the CSV file
+            game_link: Game link to update
+            duplicate_value: Value to set for DUPLICATE_ACROSS_DIVISIONS
+        """
+        self._pending_duplicate_flags.setdefault(csv_path, {})[game_link] = duplicate_value
+    
+    def materialize_duplicate_flags(self) -> List[str]:
+        """
+        Write all queued DUPLICATE_ACROSS_DIVISIONS updates.
+        
+        Returns:
+            Paths of the CSV files that were updated
+        """
+        pending, self._pending_duplicate_flags = self._pending_duplicate_flags, {}
+        
+        updated = []
+        for csv_path, flags in pending.items():
+            if self._apply_duplicate_flags(csv_path, flags):
+                logger.info(f"Updated DUPLICATE_ACROSS_DIVISIONS flag for {len(flags)} games in {csv_path}")
+                updated.append(csv_path)
+        return updated
+    
+    def _apply_duplicate_flags(self, csv_path: str, flags: Dict[str, bool]) -> bool:
+        """
+        Set DUPLICATE_ACROSS_DIVISIONS for several games in one rewrite of a CSV file.
+        
+        Args:
+            csv_path: Path to the CSV file
+            flags: Value to set, by game link
+        
         Returns:
             True if successful, False otherwise
         """
@@ -152,13 +500,12 @@ class CSVHandler:
             if 'DUPLICATE_ACROSS_DIVISIONS' not in df.columns:
                 df['DUPLICATE_ACROSS_DIVISIONS'] = False
             
-            # Update rows for this game
-            mask = df['GAMELINK'] == game_link
-            df.loc[mask, 'DUPLICATE_ACROSS_DIVISIONS'] = duplicate_value
+            # Update rows for these games
+            mask = df['GAMELINK'].isin(flags.keys())
+            df.loc[mask, 'DUPLICATE_ACROSS_DIVISIONS'] = df.loc[mask, 'GAMELINK'].map(flags)
             
             # Save updated CSV
-            df.to_csv(csv_path, index=False)
-            logger.info(f"Updated DUPLICATE_ACROSS_DIVISIONS flag for game {game_link} in {csv_path}")
+            _write_csv(df, csv_path)
             return True
             
         except Exception as e:
@@ -178,6 +525,9 @@ class CSVHandler:
             True if successful, False otherwise
         """
         try:
+            if self._stream_merge_csv_files(existing_csv_path, new_csv_path, output_path):
+                return True
+            
             # Read both CSV files
             existing_df = self.read_csv_safely(existing_csv_path)
             new_df = self.read_csv_safely(new_csv_path)
@@ -185,50 +535,115 @@ class CSVHandler:
             if existing_df is None:
                 logger.warning(f"Existing CSV {existing_csv_path} not found or empty, using new CSV only")
                 if new_df is not None:
-                    new_df.to_csv(output_path, index=False)
+                    _write_csv(new_df, output_path)
                     return True
                 return False
             
             if new_df is None or new_df.empty:
                 logger.info(f"New CSV {new_csv_path} is empty, keeping existing CSV")
-                existing_df.to_csv(output_path, index=False)
+                _copy_unchanged(existing_csv_path, output_path)
                 return True
             
-            # Get existing game IDs to avoid duplicates
-            existing_game_ids = set()
-            if 'GAMEID' in existing_df.columns:
-                existing_game_ids = set(existing_df['GAMEID'].values)
-            
-            # Filter out games that already exist
-            if 'GAMEID' in new_df.columns:
-                new_df_filtered = new_df[~new_df['GAMEID'].isin(existing_game_ids)].copy()
+            # Filter out games that already exist, by GAMEID or else GAMELINK
+            key_column = next((col for col in ('GAMEID', 'GAMELINK') if col in new_df.columns), None)
+            if key_column is None:
+                # No way to deduplicate, append all
+                logger.warning("No GAMEID or GAMELINK column found, appending all rows (may create duplicates)")
+                new_df_filtered = new_df
+            elif key_column == 'GAMELINK' and 'GAMELINK' in existing_df.columns:
+                # Long link strings: hash both sides once into shared integer codes, then compare the codes
+                codes, _ = pd.factorize(pd.concat([existing_df['GAMELINK'], new_df['GAMELINK']], ignore_index=True))
+                existing_codes = codes[:len(existing_df)]
+                new_codes = codes[len(existing_df):]
+                new_df_filtered = new_df[~np.isin(new_codes, existing_codes)]
             else:
-                # If no GAMEID column, use GAMELINK as fallback
-                existing_game_links = set()
-                if 'GAMELINK' in existing_df.columns:
-                    existing_game_links = set(existing_df['GAMELINK'].values)
-                
-                if 'GAMELINK' in new_df.columns:
-                    new_df_filtered = new_df[~new_df['GAMELINK'].isin(existing_game_links)].copy()
-                else:
-                    # No way to deduplicate, append all
-                    logger.warning("No GAMEID or GAMELINK column found, appending all rows (may create duplicates)")
-                    new_df_filtered = new_df.copy()
+                # Kept as an array so isin() hashes the values natively
+                existing_keys = np.array([])
+                if key_column in existing_df.columns:
+                    existing_keys = existing_df[key_column].unique()
+                # Boolean indexing already returns a new frame, so no copy() is needed
+                new_df_filtered = new_df[~new_df[key_column].isin(existing_keys)]
             
             if new_df_filtered.empty:
                 logger.info("No new games to add, existing CSV is up to date")
-                existing_df.to_csv(output_path, index=False)
+                _copy_unchanged(existing_csv_path, output_path)
                 return True
             
             # Merge the dataframes
             merged_df = pd.concat([existing_df, new_df_filtered], ignore_index=True)
             
             # Save merged CSV
-            merged_df.to_csv(output_path, index=False)
+            _write_csv(merged_df, output_path)
             
             logger.info(f"Merged CSV files: {len(existing_df)} existing rows + {len(new_df_filtered)} new rows = {len(merged_df)} total rows")
             return True
             
         except Exception as e:
             logger.error(f"Error merging CSV files: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _stream_merge_csv_files(self, existing_csv_path: str, new_csv_path: str, output_path: str) -> bool:
+        """
+        Merge two CSV files without loading either into a DataFrame.
+        
+        The existing file is copied byte for byte, then the new file is read
+        in chunks of MERGE_CHUNK_ROWS and only rows whose GAMEID is not in
+        the existing file are appended, so memory use does not grow with the
+        file sizes. Values are kept as text so copied rows are unchanged.
+        
+        Args:
+            existing_csv_path: Path to the existing CSV file (from Google Drive)
+            new_csv_path: Path to the new CSV file (with retried games)
+            output_path: Path to save the merged CSV file
+        
+        Returns:
+            True if the files were merged, False if they need the in-memory merge
+            (a file is missing or empty, GAMEID is missing, or the new file has
+            columns the existing one lacks)
+        """
+        existing_header = self._read_header(existing_csv_path)
+        new_header = self._read_header(new_csv_path)
+        if not existing_header or not new_header:
+            return False
+        if 'GAMEID' not in existing_header or 'GAMEID' not in new_header:
+            return False
+        if not set(new_header) <= set(existing_header):
+            return False
+        
+        existing_game_ids = self.get_existing_game_ids(existing_csv_path)
+        
+        shutil.copyfile(existing_csv_path, output_path)
+        new_rows = 0
+        with open(output_path, 'rb+') as f:
+            # Make sure appended rows start on their own line
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        
+        with open(output_path, 'a', newline='', encoding='utf-8') as out:
+            for chunk in pd.read_csv(new_csv_path, chunksize=MERGE_CHUNK_ROWS, dtype=str, keep_default_na=False):
+                chunk = chunk[~chunk['GAMEID'].isin(existing_game_ids)]
+                if chunk.empty:
+                    continue
+                chunk.reindex(columns=existing_header, fill_value='').to_csv(out, header=False, index=False)
+                new_rows += len(chunk)
+        
+        logger.info(f"Merged CSV files: appended {new_rows} new rows to the existing CSV")
+        return True
+    
+    def _read_header(self, csv_path: str) -> Optional[List[str]]:
+        """
+        Read a CSV file's header row.
+        
+        Args:
+            csv_path: Path to the CSV file
+        
+        Returns:
+            Column names, or None if the file is missing or empty
+        """
+        self._flush_appends(csv_path)
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                return next(csv.reader(f), None)
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return None
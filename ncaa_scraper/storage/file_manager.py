@@ -31,7 +31,7 @@ class FileManager:
         os.makedirs(dir_path, exist_ok=True)
         return dir_path
     
-    def get_csv_path(self, year: str, month: str, day: str, gender: str, division: str) -> str:
+    def get_csv_path(self, year: str, month: str, day: str, gender: str, division: str, create_dirs: bool = True) -> str:
         """
         Get the CSV file path for a specific date and parameters.
         
@@ -41,12 +41,16 @@ class FileManager:
             day: Day (e.g., "15")
             gender: Gender (e.g., "men", "women")
             division: Division (e.g., "d1", "d2", "d3")
+            create_dirs: Whether to create the directory structure
         
         Returns:
             Full path to the CSV file
         """
         # Create directory structure
-        dir_path = self.create_directory_structure(year, month, gender, division)
+        if create_dirs:
+            dir_path = self.create_directory_structure(year, month, gender, division)
+        else:
+            dir_path = os.path.join(self.base_output_dir, year, month, gender, division)
         
         # Generate filename
         filename = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
@@ -62,7 +66,11 @@ class FileManager:
         Returns:
             True if file exists and has content, False otherwise
         """
-        return os.path.exists(file_path) and os.path.getsize(file_path) > 0
+        # One stat call instead of exists() + getsize()
+        try:
+            return os.stat(file_path).st_size > 0
+        except OSError:
+            return False
     
     def ensure_directory_exists(self, directory_path: str) -> None:
         """
@@ -84,7 +92,9 @@ class FileManager:
             File size in bytes, 0 if file doesn't exist
         """
         try:
-            return os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            return os.stat(file_path).st_size
+        except FileNotFoundError:
+            return 0
         except OSError as e:
             logger.error(f"Error getting file size for {file_path}: {e}")
             return 0
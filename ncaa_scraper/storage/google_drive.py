@@ -3,7 +3,8 @@
 import os
 import pickle
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -18,6 +19,16 @@ logger = logging.getLogger(__name__)
 class GoogleDriveManager:
     """Manages Google Drive operations for the scraper."""
     
+    # Serializes find-then-create so concurrent scrapers don't create the same folder twice
+    _folder_lock = threading.Lock()
+    
+    # Folder IDs by (folder name, parent folder ID), shared by all managers
+    _folder_ids: Dict[Tuple[str, Optional[str]], str] = {}
+    
+    # File IDs by file name for each listed folder, shared by all managers
+    _folder_files: Dict[str, Dict[str, str]] = {}
+    _folder_files_lock = threading.Lock()
+    
     def __init__(self, config):
         self.config = config
         self.service = None
@@ -233,12 +244,60 @@ class GoogleDriveManager:
                 ).execute()
                 logger.info(f"Successfully uploaded {file_path} to Google Drive. File ID: {file.get('id')}")
             
+            # Keep the cached listing of the folder in step with the upload
+            if folder_id:
+                with self._folder_files_lock:
+                    folder_files = self._folder_files.get(folder_id)
+                    if folder_files is not None:
+                        folder_files[file_name] = file.get('id')
+            
             return file.get('id')
             
         except Exception as e:
             logger.error(f"Failed to upload {file_path} to Google Drive: {e}")
             return None
     
+    def list_folder_files(self, folder_id: str) -> Dict[str, str]:
+        """
+        List the files directly inside a Google Drive folder.
+        
+        The listing is cached per folder, so checking every day of a month
+        costs one API call instead of one per day. upload_file() keeps the
+        cached listing current.
+        
+        Args:
+            folder_id: Google Drive folder ID to list
+        
+        Returns:
+            Dictionary of file name to Google Drive file ID
+        """
+        with self._folder_files_lock:
+            folder_files = self._folder_files.get(folder_id)
+        if folder_files is not None:
+            return folder_files
+        
+        folder_files = {}
+        page_token = None
+        while True:
+            results = self.service.files().list(
+                q=f"'{folder_id}' in parents and trashed=false",
+                fields="nextPageToken, files(id, name)",
+                pageSize=1000,
+                pageToken=page_token,
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
+            ).execute()
+            for file in results.get('files', []):
+                # Keep the first match, as file_exists() does
+                folder_files.setdefault(file['name'], file['id'])
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+        
+        with self._folder_files_lock:
+            self._folder_files[folder_id] = folder_files
+        return folder_files
+    
     def create_folder(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Optional[str]:
         """
         Create a folder in Google Drive.
@@ -327,13 +386,16 @@ class GoogleDriveManager:
         Returns:
             Google Drive folder ID if successful, None if failed
         """
-        # Try to find existing folder first
-        folder_id = self.find_folder(folder_name, parent_folder_id)
-        if folder_id:
+        key = (folder_name, parent_folder_id)
+        with self._folder_lock:
+            if key in self._folder_ids:
+                return self._folder_ids[key]
+            
+            # Try to find existing folder first, create new folder if not found
+            folder_id = self.find_folder(folder_name, parent_folder_id) or self.create_folder(folder_name, parent_folder_id)
+            if folder_id:
+                self._folder_ids[key] = folder_id
             return folder_id
-        
-        # Create new folder if not found
-        return self.create_folder(folder_name, parent_folder_id)
     
     def create_folder_structure(self, year: str, month: str, gender: str, division: str, base_folder_id: Optional[str] = None) -> Optional[str]:
         """
@@ -368,13 +430,6 @@ class GoogleDriveManager:
             if not month_folder_id:
                 return None
             
-            # DEBUG: Check if gender folder already exists
-            existing_gender_folder = self.find_folder(gender, month_folder_id)
-            if existing_gender_folder:
-                logger.info(f"DEBUG: Gender folder '{gender}' already exists in month '{month}' (ID: {existing_gender_folder})")
-            else:
-                logger.info(f"DEBUG: Gender folder '{gender}' NOT found in month '{month}', will create new one")
-            
             # Create gender folder under month
             gender_folder_id = self.find_or_create_folder(gender, month_folder_id)
             if not gender_folder_id:
@@ -480,7 +535,7 @@ class GoogleDriveManager:
             if day:
                 # Check for specific day file
                 file_name = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
-                existing_file_id = self.file_exists(file_name, folder_id)
+                existing_file_id = self.list_folder_files(folder_id).get(file_name)
                 return existing_file_id is not None, existing_file_id
             else:
                 # Check for any files in the month folder
@@ -537,7 +592,7 @@ class GoogleDriveManager:
             # Find the file - construct filename from parameters to match Google Drive naming convention
             # (local_path may have .existing suffix which doesn't exist in Google Drive)
             file_name = f"basketball_{gender}_{division}_{year}_{month}_{day}.csv"
-            file_id = self.file_exists(file_name, folder_id)
+            file_id = self.list_folder_files(folder_id).get(file_name)
             
             if not file_id:
                 logger.info(f"File {file_name} does not exist in Google Drive, skipping download")
@@ -559,7 +614,7 @@ class GoogleDriveManager:
             while not done:
                 status, done = downloader.next_chunk()
                 if status:
-                    logger.debug(f"Download progress: {int(status.progress() * 100)}%")
+                    logger.debug("Download progress: %d%%", int(status.progress() * 100))
             
             # Write to file
             with open(local_path, 'wb') as f:
@@ -9,6 +9,23 @@ from ..config.constants import NCAA_BASE_URL, Division, Gender
 
 logger = logging.getLogger(__name__)
 
+# Map gender to sport code
+_GENDER_TO_SPORT = {
+    Gender.WOMEN: 'WBB',
+    Gender.MEN: 'MBB'
+}
+
+# Map division to number
+_DIVISION_TO_NUM = {
+    Division.D1: '1',
+    Division.D2: '2',
+    Division.D3: '3'
+}
+
+# Map a URL's sport code and division number back to our names
+_SPORT_TO_GENDER = {'WBB': 'women', 'MBB': 'men'}
+_NUM_TO_DIVISION = {'1': 'd1', '2': 'd2', '3': 'd3'}
+
 
 def generate_ncaa_urls(
     date_str: str,
@@ -35,26 +52,13 @@ def generate_ncaa_urls(
     date_obj = datetime.strptime(date_str, '%Y/%m/%d').date()
     game_date = date_obj.strftime('%m/%d/%Y')
     
-    # Map gender to sport code
-    gender_to_sport = {
-        Gender.WOMEN: 'WBB',
-        Gender.MEN: 'MBB'
-    }
-    
-    # Map division to number
-    division_to_num = {
-        Division.D1: '1',
-        Division.D2: '2',
-        Division.D3: '3'
-    }
-    
     urls = []
     for gender in genders:
         for division in divisions:
             params = {
                 'utf8': '✓',  # URL encoded as %E2%9C%93
-                'sport_code': gender_to_sport[gender],
-                'division': division_to_num[division],
+                'sport_code': _GENDER_TO_SPORT[gender],
+                'division': _DIVISION_TO_NUM[division],
                 'game_date': game_date,
                 'commit': 'Submit'
             }
@@ -80,17 +84,13 @@ def parse_url_components(url: str) -> Dict[str, str]:
         
         # Extract sport code and convert to gender
         sport_code = params.get('sport_code', [None])[0]
-        if sport_code == 'WBB':
-            gender = 'women'
-        elif sport_code == 'MBB':
-            gender = 'men'
-        else:
+        gender = _SPORT_TO_GENDER.get(sport_code)
+        if not gender:
             raise ValueError(f"Unknown sport_code: {sport_code}")
         
         # Extract division and convert to d1/d2/d3 format
         division_num = params.get('division', [None])[0]
-        division_map = {'1': 'd1', '2': 'd2', '3': 'd3'}
-        division = division_map.get(division_num)
+        division = _NUM_TO_DIVISION.get(division_num)
         if not division:
             raise ValueError(f"Unknown division: {division_num}")
         
@@ -0,0 +1,118 @@
+"""Tests for the failed games file."""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+
+from ncaa_scraper import failed_games
+
+
+GAME_DATE = date(2025, 1, 12)
+
+
+class FailedGamesWriterConcurrencyTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = str(Path(self.tmp_dir) / 'failed_games.json')
+        failed_games._cache.clear()
+        with failed_games.FailedGamesWriter(self.path) as writer:
+            for i in range(200):
+                writer.save(f'game-{i}', GAME_DATE, 'd1', 'men')
+                writer.save(f'game-{i}', GAME_DATE, 'd1', 'women')
+    
+    def tearDown(self):
+        failed_games._cache.clear()
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_writers_do_not_share_cached_data(self):
+        with failed_games.FailedGamesWriter(self.path) as first, failed_games.FailedGamesWriter(self.path) as second:
+            self.assertIsNot(first.data, second.data)
+            cached = failed_games._load_cached(Path(self.path))
+            self.assertIsNot(first.data, cached)
+            
+            first.mark_retried('game-0', GAME_DATE, 'd1', 'men', success=True)
+            self.assertIn('d1|men', second.data[GAME_DATE.isoformat()]['game-0'])
+            self.assertIn('d1|men', cached[GAME_DATE.isoformat()]['game-0'])
+    
+    def test_threads_retrying_the_same_date(self):
+        errors = []
+        start = threading.Barrier(2)
+        
+        def retry(gender):
+            try:
+                with failed_games.FailedGamesWriter(self.path) as writer:
+                    start.wait()
+                    for i in range(200):
+                        writer.mark_retried(f'game-{i}', GAME_DATE, 'd1', gender, success=True)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=retry, args=(gender,)) for gender in ('men', 'women')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        failed_games._cache.clear()
+        self.assertEqual(failed_games.load_failed_games(self.path), {})
+
+
+
+class FailedGamesJournalTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = str(Path(self.tmp_dir) / 'failed_games.json')
+        failed_games._cache.clear()
+    
+    def tearDown(self):
+        failed_games._cache.clear()
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_non_string_fields_survive_a_reload(self):
+        with failed_games.FailedGamesWriter(self.path) as writer:
+            writer.save(6330000, GAME_DATE, 'd1', 'men', error_message=None)
+            self.assertTrue(writer.journal_path.exists())
+        
+        failed_games._cache.clear()
+        entry = failed_games.load_failed_games(self.path)[GAME_DATE.isoformat()]['6330000']['d1|men']
+        self.assertIsNone(entry['error_message'])
+    
+    def test_truncated_snapshot_is_set_aside_and_rewritten(self):
+        with open(self.path, 'w') as f:
+            f.write('{"2025-01-11": {"game-a": {')
+        
+        with failed_games.FailedGamesWriter(self.path) as writer:
+            writer.save('game-b', GAME_DATE, 'd1', 'men')
+            self.assertIn('game-b', failed_games.load_failed_games(self.path, GAME_DATE)[GAME_DATE.isoformat()])
+        
+        self.assertFalse(Path(self.path + '.journal').exists())
+        self.assertTrue(Path(self.path + '.corrupt').exists())
+        failed_games._cache.clear()
+        self.assertEqual(list(failed_games.load_failed_games(self.path)), [GAME_DATE.isoformat()])
+    
+    def test_sharded_writer_touches_only_recorded_dates(self):
+        shard_dir = Path(self.tmp_dir) / 'failed_games'
+        shard_dir.mkdir()
+        (shard_dir / '2025-01-10.json').write_bytes(b'')
+        (shard_dir / '2025-01-11.json').write_text('{"game-a": {"d1|men": {"division": "d1", "gender": "men"}}}')
+        other_mtime = (shard_dir / '2025-01-11.json').stat().st_mtime_ns
+        
+        with failed_games.FailedGamesWriter(str(shard_dir)) as writer:
+            writer.save('game-b', GAME_DATE, 'd1', 'men')
+            self.assertEqual(list(writer.data), [GAME_DATE.isoformat()])
+        
+        self.assertEqual((shard_dir / '2025-01-11.json').stat().st_mtime_ns, other_mtime)
+        self.assertEqual(failed_games.load_failed_games(str(shard_dir), date(2025, 1, 10)), {'2025-01-10': {}})
+        loaded = failed_games.load_failed_games(str(shard_dir))
+        self.assertEqual(sorted(loaded), ['2025-01-11', GAME_DATE.isoformat()])
+        self.assertIn('game-b', loaded[GAME_DATE.isoformat()])
+
+
+if __name__ == '__main__':
+    unittest.main()